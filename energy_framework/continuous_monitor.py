@@ -5,16 +5,154 @@ Generates live energy monitoring data continuously for the dashboard
 """
 
 import time
-import random
-import pandas as pd
-import json
+import numpy as np
 import os
+import csv
+import atexit
+import queue
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 import threading
 import signal
 import sys
 
+# Shared with the simulation: the optional-Numba njit and the host state codes
+from src.utils.jit import njit
+from src.infrastructure.host_monitor import STATE_IDLE, STATE_ACTIVE, STATE_OVERLOADED, STATE_NAMES
+
+# Fast JSON serialization: prefer orjson, then ujson, then the standard library
+try:
+    import orjson
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes (NumPy arrays and scalars are handled natively)."""
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+    
+    def _json_default(obj):
+        """Convert NumPy arrays and scalars for the pure-Python encoders."""
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes."""
+        kwargs = {'indent': 2} if indent else {}
+        return _json.dumps(obj, default=_json_default, **kwargs).encode('utf-8')
+
+# State name -> code, for reloading a CSV left by a previous run
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES.tolist())}
+
+# Uniform (low, high) ranges of the per-tick random inputs, drawn in one batch
+SAMPLE_RANGES = np.array([
+    (0.3, 0.8),      # base CPU
+    (-0.1, 0.1),     # CPU variation
+    (0.4, 0.7),      # base memory
+    (-0.05, 0.05),   # memory variation
+    (-2.0, 2.0),     # temperature noise
+    (-5.0, 5.0),     # latency noise
+    (-10.0, 10.0),   # throughput noise
+])
+SAMPLE_LOW = SAMPLE_RANGES[:, :1]
+SAMPLE_SPAN = SAMPLE_RANGES[:, 1:] - SAMPLE_LOW
+
+# Columnar layout of one log row (also the CSV column order); the ring buffer
+# is a fixed-size structured array of these instead of a list of dicts.
+# Simulated metrics are low precision, so they are stored as float32 and the
+# host state as an int8 code (decoded with STATE_NAMES when rows are written)
+ROW_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('datetime', 'U19'),
+    ('host_id', 'U16'),
+    ('cpu_utilization', 'f4'),
+    ('memory_utilization', 'f4'),
+    ('cores', 'i2'),
+    ('ram_gb', 'f4'),
+    ('power_watts', 'f4'),
+    ('temperature_c', 'f4'),
+    ('active_containers', 'i2'),
+    ('state', 'i1'),
+    ('is_idle', '?'),
+    ('latency_ms', 'f4'),
+    ('throughput_mbps', 'f4'),
+])
+
+# CSV column order, fixed once at import (the dtype's field names as a tuple)
+CSV_HEADERS = ROW_DTYPE.names
+
+# Decimal places float32 metrics are written with (about float32 precision)
+FLOAT_DECIMALS = 4
+
+# Layout of rows as written to CSV/JSON: states decoded, metrics widened to float64
+EMIT_DTYPE = np.dtype([
+    (name, 'U10' if name == 'state' else ('f8' if ROW_DTYPE[name].kind == 'f' else ROW_DTYPE[name]))
+    for name in CSV_HEADERS
+])
+
+# Keep only last 1000 data points to prevent file from growing too large
+MAX_DATA_POINTS = 1000
+
+# The CSV is append-only and is compacted back to MAX_DATA_POINTS rows once it
+# holds this many, so the full rewrite only happens once every ~1000 rows.
+# Between compactions the CSV therefore holds MAX_DATA_POINTS to CSV_COMPACT_ROWS
+# rows; kpis.json reports that same CSV row count as total_data_points
+# (the dashboard counts the CSV rows), not the ring buffer size
+CSV_COMPACT_ROWS = 2 * MAX_DATA_POINTS
+
+# Write buffer size for the long-lived CSV append handle
+CSV_BUFFER_BYTES = 1 << 16
+
+# The JSON snapshot is only needed by the dashboard, write it every N flushes
+JSON_FLUSH_EVERY = 5
+
+# Pending ticks the background writer may fall behind by; when full, the oldest
+# pending tick is dropped and the CSV is rebuilt from the ring buffer next tick
+IO_QUEUE_SIZE = 4
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write data to path via a temporary file and os.replace, so readers never see a partial file."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+@njit(cache=True)
+def _compute_metrics(base_cpu, cpu_variation, base_memory, memory_variation, p_idle, p_delta,
+                     active_containers, temperature_noise, latency_noise, throughput_noise):
+    """Compute host metrics from pre-sampled random draws (one array entry per host)."""
+    cpu_util = np.minimum(np.maximum(base_cpu + cpu_variation, 0.1), 0.95)
+    memory_util = np.minimum(np.maximum(base_memory + memory_variation, 0.2), 0.9)
+    
+    # Calculate power consumption based on CPU utilization
+    power = p_idle + p_delta * cpu_util
+    
+    # Determine host state from two masks, computed once (idle takes precedence)
+    is_idle = (cpu_util < 0.1) & (memory_util < 0.1)
+    is_overloaded = (cpu_util > 0.9) | (memory_util > 0.9)
+    state_code = np.where(is_idle, STATE_IDLE,
+                          np.where(is_overloaded, STATE_OVERLOADED, STATE_ACTIVE)).astype(np.int8)
+    
+    # Temperature correlates with CPU usage
+    temperature = 35 + (cpu_util * 25) + temperature_noise
+    
+    # Latency increases with CPU usage, clamped between 5-100ms
+    latency_ms = 10.0 + cpu_util * 50 + latency_noise
+    latency_ms = np.minimum(np.maximum(latency_ms, 5.0), 100.0)
+    
+    # Throughput grows with CPU/memory utilization and containers, clamped between 50-1000 Mbps
+    throughput_factor = (cpu_util * 0.7 + memory_util * 0.3) * active_containers
+    throughput_mbps = 100.0 + (throughput_factor * 50) + throughput_noise
+    throughput_mbps = np.minimum(np.maximum(throughput_mbps, 50.0), 1000.0)
+    
+    return cpu_util, memory_util, power, temperature, state_code, is_idle, latency_ms, throughput_mbps
+
+
 class ContinuousEnergyMonitor:
     """Continuous real-time energy monitoring system."""
     
@@ -37,72 +175,169 @@ class ContinuousEnergyMonitor:
             {"id": "host-005", "cores": 8, "ram_gb": 16.0, "p_idle": 80, "p_max": 200},
         ]
         
+        # Host constants as arrays (one entry per host) for vectorized generation
+        self._host_ids = np.array([h["id"] for h in self.hosts])
+        self._cores = np.array([h["cores"] for h in self.hosts])
+        self._ram_gb = np.array([h["ram_gb"] for h in self.hosts], dtype=float)
+        self._p_idle = np.array([h["p_idle"] for h in self.hosts], dtype=float)
+        self._p_max = np.array([h["p_max"] for h in self.hosts], dtype=float)
+        
+        # Derived per-host constants, fixed for the lifetime of the monitor
+        self._p_delta = self._p_max - self._p_idle
+        self._max_containers = self._cores * 2
+        self._rng = np.random.default_rng()
+        
         self.running = True
         self.data_points = 0
+        self._tick_count = 0
+        self._flush_count = 0
+        
+        # Rows generated since the last flush to disk
+        self._pending = []
+        
+        # In-memory ring buffer of the most recent rows (mirrors the CSV tail)
+        self._buf = np.empty(MAX_DATA_POINTS, dtype=ROW_DTYPE)
+        self._idx = 0   # next write position
+        self._size = 0  # number of valid rows
+        self._csv_rows = 0
+        self._csv_initialized = False
+        self._csv_fh = None
+        self._csv_writer = None
+        
+        # Background writer, started by start_monitoring (writes are inline otherwise)
+        self._io_queue = None
+        self._io_thread = None
+        
+        # Rows of the most recent tick (one per host), used for the KPI snapshot
+        self._latest = None
+        self._last_now_iso = None
         
         # Initialize CSV with headers if it doesn't exist
         if not self.csv_path.exists():
             self._initialize_csv()
+        else:
+            self._load_existing_rows()
+        
+        # Make sure buffered rows reach the disk on interpreter exit
+        atexit.register(self._close_csv)
     
     def _initialize_csv(self):
         """Initialize CSV file with headers."""
-        headers = [
-            'timestamp', 'datetime', 'host_id', 'cpu_utilization', 'memory_utilization',
-            'cores', 'ram_gb', 'power_watts', 'temperature_c', 'active_containers',
-            'state', 'is_idle', 'latency_ms', 'throughput_mbps'
-        ]
-        df = pd.DataFrame(columns=headers)
-        df.to_csv(self.csv_path, index=False)
-    
-    def _calculate_power_consumption(self, cpu_util, p_idle, p_max):
-        """Calculate power consumption based on CPU utilization."""
-        return p_idle + (p_max - p_idle) * cpu_util
-    
-    def _generate_realistic_metrics(self, host):
-        """Generate realistic metrics for a host."""
-        # Simulate realistic CPU and memory patterns
-        base_cpu = random.uniform(0.3, 0.8)
-        cpu_variation = random.uniform(-0.1, 0.1)
-        cpu_util = max(0.1, min(0.95, base_cpu + cpu_variation))
-        
-        base_memory = random.uniform(0.4, 0.7)
-        memory_variation = random.uniform(-0.05, 0.05)
-        memory_util = max(0.2, min(0.9, base_memory + memory_variation))
-        
-        # Calculate power consumption
-        power = self._calculate_power_consumption(cpu_util, host["p_idle"], host["p_max"])
-        
-        # Generate realistic container count
-        max_containers = host["cores"] * 2
-        active_containers = random.randint(0, max_containers)
-        
-        # Determine host state
-        if cpu_util < 0.1 and memory_util < 0.1:
-            state = "idle"
-            is_idle = True
-        elif cpu_util > 0.9 or memory_util > 0.9:
-            state = "overloaded"
-            is_idle = False
-        else:
-            state = "active"
-            is_idle = False
-        
-        # Generate temperature (correlates with CPU usage)
-        temperature = 35 + (cpu_util * 25) + random.uniform(-2, 2)
-        
-        # Generate latency (lower is better, inversely related to CPU utilization)
-        # Higher CPU utilization may lead to higher latency
-        base_latency = 10.0  # Base latency in ms
-        latency_variation = cpu_util * 50  # Latency increases with CPU usage
-        latency_ms = base_latency + latency_variation + random.uniform(-5, 5)
-        latency_ms = max(5.0, min(100.0, latency_ms))  # Clamp between 5-100ms
-        
-        # Generate throughput (higher is better, related to CPU and containers)
-        # More containers and better CPU utilization = higher throughput
-        base_throughput = 100.0  # Base throughput in Mbps
-        throughput_factor = (cpu_util * 0.7 + memory_util * 0.3) * active_containers
-        throughput_mbps = base_throughput + (throughput_factor * 50) + random.uniform(-10, 10)
-        throughput_mbps = max(50.0, min(1000.0, throughput_mbps))  # Clamp between 50-1000 Mbps
+        with open(self.csv_path, 'w', newline='') as f:
+            csv.writer(f).writerow(CSV_HEADERS)
+        self._csv_rows = 0
+        self._csv_initialized = True
+    
+    def _load_existing_rows(self):
+        """Seed the ring buffer from a CSV left by a previous run."""
+        try:
+            with open(self.csv_path, newline='') as f:
+                rows = deque(csv.DictReader(f), maxlen=MAX_DATA_POINTS)
+            
+            loaded = np.empty(len(rows), dtype=ROW_DTYPE)
+            for name in ROW_DTYPE.names:
+                # Columns missing from older logs come back as None
+                values = [row.get(name) or '' for row in rows]
+                kind = ROW_DTYPE[name].kind
+                if name == 'state':
+                    loaded[name] = [STATE_CODES.get(v, STATE_ACTIVE) for v in values]
+                elif kind == 'b':
+                    loaded[name] = [v == 'True' for v in values]
+                elif kind == 'f':
+                    loaded[name] = [float(v) if v else np.nan for v in values]
+                elif kind == 'i':
+                    loaded[name] = [int(float(v)) if v else 0 for v in values]
+                else:
+                    loaded[name] = values
+            self._append_rows(loaded)
+        except Exception as e:
+            print(f"Error loading existing CSV: {e}")
+        
+        # Rewrite once so the on-disk log matches the buffer
+        self._rewrite_csv()
+        self._csv_rows = self._size
+        self._csv_initialized = True
+    
+    def _open_csv(self):
+        """Open (or reuse) the append-mode CSV handle."""
+        if self._csv_fh is None:
+            self._csv_fh = open(self.csv_path, 'a', newline='', buffering=CSV_BUFFER_BYTES)
+            self._csv_writer = csv.writer(self._csv_fh)
+        return self._csv_writer
+    
+    def _close_csv(self):
+        """Close the append-mode CSV handle if it is open."""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+    
+    def _rewrite_csv(self, emitted=None):
+        """Rewrite the CSV from the ring buffer (header + last MAX_DATA_POINTS rows)."""
+        if emitted is None:
+            emitted = self._emit_rows(self._buffered_rows())
+        self._close_csv()
+        
+        # Write the rotated log next to the old one and swap it in atomically
+        tmp_path = self.csv_path.with_suffix('.csv.tmp')
+        with open(tmp_path, 'w', newline='', buffering=CSV_BUFFER_BYTES) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADERS)
+            writer.writerows(emitted)
+        os.replace(tmp_path, self.csv_path)
+    
+    def _append_rows(self, rows):
+        """Write rows into the ring buffer, overwriting the oldest entries."""
+        positions = (self._idx + np.arange(len(rows))) % MAX_DATA_POINTS
+        self._buf[positions] = rows
+        self._idx = (self._idx + len(rows)) % MAX_DATA_POINTS
+        self._size = min(self._size + len(rows), MAX_DATA_POINTS)
+    
+    def _buffered_rows(self):
+        """Return the buffered rows in chronological order."""
+        if self._size < MAX_DATA_POINTS:
+            return self._buf[:self._size].copy()
+        return np.concatenate((self._buf[self._idx:], self._buf[:self._idx]))
+    
+    @staticmethod
+    def _emit_rows(rows):
+        """Convert structured rows to plain tuples for writing (state names, rounded metrics)."""
+        out = np.empty(len(rows), dtype=EMIT_DTYPE)
+        for name in ROW_DTYPE.names:
+            column = rows[name]
+            if name == 'state':
+                out[name] = STATE_NAMES[column]
+            elif column.dtype == np.float32:
+                out[name] = np.round(column.astype(np.float64), FLOAT_DECIMALS)
+            else:
+                out[name] = column
+        return out.tolist()
+    
+    @staticmethod
+    def _to_records(emitted):
+        """Convert emitted row tuples to a list of dicts (only done at the JSON boundary)."""
+        return [dict(zip(CSV_HEADERS, row)) for row in emitted]
+    
+    def _write_json_snapshot(self, emitted):
+        """Save the buffered rows as JSON for the dashboard."""
+        _atomic_write_bytes(self.json_path, _json_dumps(self._to_records(emitted)))
+    
+    def _generate_realistic_metrics(self):
+        """Generate realistic metrics for all hosts at once (one array entry per host)."""
+        rng = self._rng
+        num_hosts = len(self.hosts)
+        
+        # Sample all random inputs in two batched draws, then run the compiled kernel
+        samples = SAMPLE_LOW + SAMPLE_SPAN * rng.random((len(SAMPLE_RANGES), num_hosts))
+        (base_cpu, cpu_variation, base_memory, memory_variation,
+         temperature_noise, latency_noise, throughput_noise) = samples
+        active_containers = rng.integers(0, self._max_containers + 1)
+        
+        (cpu_util, memory_util, power, temperature, state_code,
+         is_idle, latency_ms, throughput_mbps) = _compute_metrics(
+            base_cpu, cpu_variation, base_memory, memory_variation, self._p_idle, self._p_delta,
+            active_containers, temperature_noise, latency_noise, throughput_noise
+        )
         
         return {
             'cpu_utilization': cpu_util,
@@ -110,125 +345,226 @@ class ContinuousEnergyMonitor:
             'power_watts': power,
             'temperature_c': temperature,
             'active_containers': active_containers,
-            'state': state,
+            'state': state_code,
             'is_idle': is_idle,
             'latency_ms': latency_ms,
             'throughput_mbps': throughput_mbps
         }
     
     def _generate_data_point(self):
-        """Generate a single data point for all hosts."""
-        current_time = datetime.now(timezone.utc)
-        timestamp = current_time.timestamp()
+        """Generate a single data point for all hosts.
+        
+        Returns the structured rows (one per host) and the tick's
+        (total_power, active_hosts, total_containers) for the status line.
+        """
+        # One clock read per tick, shared by every host row
+        timestamp = time.time()
+        current_time = datetime.fromtimestamp(timestamp, timezone.utc)
         datetime_str = current_time.strftime('%Y-%m-%d %H:%M:%S')
+        # KPI last_updated keeps its local, timezone-naive ISO format
+        self._last_now_iso = datetime.fromtimestamp(timestamp).isoformat()
         
-        data_points = []
+        # Fill one structured row per host straight from the metric arrays
+        data_points = np.empty(len(self.hosts), dtype=ROW_DTYPE)
+        data_points['timestamp'] = timestamp
+        data_points['datetime'] = datetime_str
+        data_points['host_id'] = self._host_ids
+        data_points['cores'] = self._cores
+        data_points['ram_gb'] = self._ram_gb
+        for key, values in self._generate_realistic_metrics().items():
+            data_points[key] = values
         
-        for host in self.hosts:
-            metrics = self._generate_realistic_metrics(host)
-            
-            data_point = {
-                'timestamp': timestamp,
-                'datetime': datetime_str,
-                'host_id': host["id"],
-                'cpu_utilization': metrics['cpu_utilization'],
-                'memory_utilization': metrics['memory_utilization'],
-                'cores': host["cores"],
-                'ram_gb': host["ram_gb"],
-                'power_watts': metrics['power_watts'],
-                'temperature_c': metrics['temperature_c'],
-                'active_containers': metrics['active_containers'],
-                'state': metrics['state'],
-                'is_idle': metrics['is_idle'],
-                'latency_ms': metrics['latency_ms'],
-                'throughput_mbps': metrics['throughput_mbps']
-            }
-            data_points.append(data_point)
-        
-        return data_points
-    
-    def _update_csv(self, data_points):
-        """Update CSV file with new data points."""
+        self._latest = data_points
+        
+        # Status line totals as single column reductions
+        tick_summary = (
+            float(data_points['power_watts'].sum()),
+            int(np.count_nonzero(data_points['state'] == STATE_ACTIVE)),
+            int(data_points['active_containers'].sum()),
+        )
+        
+        return data_points, tick_summary
+    
+    def _record_tick(self, data_points):
+        """Add a tick's rows to the ring buffer and queue them for the next flush."""
+        self._append_rows(data_points)
+        self._pending.append(data_points)
+        self._tick_count += 1
+        self.data_points += len(data_points)
+    
+    def _prepare_csv_write(self, final: bool = False):
+        """Describe the CSV/JSON writes needed for the rows recorded since the last flush.
+        
+        final forces the JSON snapshot so it matches the CSV when the monitor stops.
+        """
+        if not self._pending:
+            data_points = self._buf[:0]  # nothing new (a final flush still refreshes the JSON and KPIs)
+        elif len(self._pending) > 1:
+            data_points = np.concatenate(self._pending)
+        else:
+            data_points = self._pending[0]
+        self._pending = []
+        self._flush_count += 1
+        
+        # The file is known to exist once initialized, so no per-tick stat() is needed;
+        # after a failed or dropped write the flag is cleared and the log is rebuilt from the buffer
+        rewrite = not self._csv_initialized or self._csv_rows + len(data_points) > CSV_COMPACT_ROWS
+        if rewrite:
+            # Compact the log back down to the last MAX_DATA_POINTS rows
+            csv_rows = self._buffered_rows()
+            self._csv_rows = len(csv_rows)
+            self._csv_initialized = True
+        else:
+            # Append only the new rows
+            csv_rows = data_points
+            self._csv_rows += len(data_points)
+        
+        # Also save as JSON for dashboard (on a slower cadence)
+        json_rows = None
+        if final or self._flush_count % JSON_FLUSH_EVERY == 0:
+            json_rows = csv_rows if rewrite else self._buffered_rows()
+        
+        return csv_rows, rewrite, json_rows
+    
+    def _write_csv(self, csv_rows, rewrite, json_rows):
+        """Write prepared rows to the CSV (append or full rewrite) and the JSON snapshot."""
         try:
-            # Read existing data
-            if self.csv_path.exists() and os.path.getsize(self.csv_path) > 0:
-                df = pd.read_csv(self.csv_path)
+            emitted = self._emit_rows(csv_rows)
+            if rewrite:
+                self._rewrite_csv(emitted)
             else:
-                df = pd.DataFrame()
-            
-            # Append new data
-            new_df = pd.DataFrame(data_points)
-            df = pd.concat([df, new_df], ignore_index=True)
-            
-            # Keep only last 1000 data points to prevent file from growing too large
-            if len(df) > 1000:
-                df = df.tail(1000).reset_index(drop=True)
-            
-            # Save to CSV
-            df.to_csv(self.csv_path, index=False)
+                self._open_csv().writerows(emitted)
+                self._csv_fh.flush()
             
-            # Also save as JSON for dashboard
-            df.to_json(self.json_path, orient='records', date_format='iso')
-            
-            self.data_points += len(data_points)
+            if json_rows is not None:
+                # A compaction and the snapshot share the same rows, so convert them once
+                json_emitted = emitted if json_rows is csv_rows else self._emit_rows(json_rows)
+                self._write_json_snapshot(json_emitted)
             
         except Exception as e:
+            self._csv_initialized = False
             print(f"Error updating CSV: {e}")
     
-    def _update_kpis(self):
-        """Update KPIs file."""
+    def _compute_kpis(self):
+        """Calculate the KPI snapshot from the latest tick (None before the first tick)."""
+        latest = self._latest
+        if latest is None:
+            return None
+        
+        # Calculate all KPIs from the latest row of each host; the float32
+        # columns are reduced in float64 and rounded to the log's precision,
+        # so the report carries no float32 artifacts
+        total_hosts = len(latest)
+        total_power = round(float(latest['power_watts'].sum(dtype=np.float64)), FLOAT_DECIMALS)
+        avg_power = total_power / total_hosts
+        total_containers = int(latest['active_containers'].sum())
+        active_hosts = int(np.count_nonzero(latest['state'] == STATE_ACTIVE))
+        idle_hosts = int(np.count_nonzero(latest['state'] == STATE_IDLE))
+        
+        # Calculate derived metrics
+        power_per_container = (avg_power / total_containers) if total_containers > 0 else 0.0
+        containers_per_host = (total_containers / total_hosts) if total_hosts > 0 else 0.0
+        
+        # Calculate total energy (approximate: average power * time in hours)
+        # For real-time monitoring, estimate based on average power
+        # Assuming 1 hour of operation for estimation
+        total_energy_wh = avg_power * 1.0  # Watts * hours = Wh
+        
+        kpis = {
+            'total_power_watts': total_power,
+            'average_power_watts': avg_power,
+            'total_energy_wh': total_energy_wh,
+            'average_power_per_container': power_per_container,
+            'total_containers': total_containers,
+            'total_hosts': total_hosts,
+            'active_hosts': active_hosts,
+            'average_active_hosts': float(active_hosts),  # For compatibility
+            'idle_hosts': idle_hosts,
+            'average_containers_per_host': containers_per_host,
+            'average_cpu_utilization': round(float(latest['cpu_utilization'].mean(dtype=np.float64)) * 100, FLOAT_DECIMALS),  # Already in percentage
+            'average_memory_utilization': round(float(latest['memory_utilization'].mean(dtype=np.float64)) * 100, FLOAT_DECIMALS),  # Already in percentage
+            'total_data_points': self._csv_rows,  # rows in the CSV, as the dashboard counts them
+            'metrics_collected': self._size,  # Alias for compatibility
+            'last_updated': self._last_now_iso,
+            'carbon_footprint_kg': float((total_power * 0.0005) / 1000),
+            'estimated_cost_usd': float((total_power * 0.12) / 1000)
+        }
+        
+        return kpis
+    
+    def _write_kpis(self, kpis):
+        """Write the KPI snapshot to disk."""
         try:
-            if self.csv_path.exists() and os.path.getsize(self.csv_path) > 0:
-                df = pd.read_csv(self.csv_path)
-                
-                if not df.empty:
-                    latest = df.groupby('host_id').last()
-                    
-                    # Calculate all KPIs
-                    total_power = float(latest['power_watts'].sum())
-                    avg_power = float(latest['power_watts'].mean())
-                    total_containers = int(latest['active_containers'].sum())
-                    total_hosts = int(len(latest))
-                    active_hosts = int((latest['state'] == 'active').sum())
-                    idle_hosts = int((latest['state'] == 'idle').sum())
-                    
-                    # Calculate derived metrics
-                    power_per_container = (avg_power / total_containers) if total_containers > 0 else 0.0
-                    containers_per_host = (total_containers / total_hosts) if total_hosts > 0 else 0.0
-                    
-                    # Calculate total energy (approximate: average power * time in hours)
-                    # For real-time monitoring, estimate based on average power
-                    # Assuming 1 hour of operation for estimation
-                    total_energy_wh = avg_power * 1.0  # Watts * hours = Wh
-                    
-                    kpis = {
-                        'total_power_watts': total_power,
-                        'average_power_watts': avg_power,
-                        'total_energy_wh': total_energy_wh,
-                        'average_power_per_container': power_per_container,
-                        'total_containers': total_containers,
-                        'total_hosts': total_hosts,
-                        'active_hosts': active_hosts,
-                        'average_active_hosts': float(active_hosts),  # For compatibility
-                        'idle_hosts': idle_hosts,
-                        'average_containers_per_host': containers_per_host,
-                        'average_cpu_utilization': float(latest['cpu_utilization'].mean() * 100),  # Already in percentage
-                        'average_memory_utilization': float(latest['memory_utilization'].mean() * 100),  # Already in percentage
-                        'total_data_points': int(len(df)),
-                        'metrics_collected': int(len(df)),  # Alias for compatibility
-                        'last_updated': datetime.now().isoformat(),
-                        'carbon_footprint_kg': float((total_power * 0.0005) / 1000),
-                        'estimated_cost_usd': float((total_power * 0.12) / 1000)
-                    }
-                    
-                    with open(self.kpis_path, 'w') as f:
-                        json.dump(kpis, f, indent=2)
-                        
+            _atomic_write_bytes(self.kpis_path, _json_dumps(kpis, indent=True))
         except Exception as e:
             print(f"Error updating KPIs: {e}")
     
-    def start_monitoring(self, interval: float = 2.0):
-        """Start continuous monitoring."""
+    def _io_worker(self):
+        """Background thread: write queued ticks until the stop sentinel arrives."""
+        while True:
+            item = self._io_queue.get()
+            if item is None:
+                break
+            csv_job, kpis = item
+            self._write_csv(*csv_job)
+            if kpis is not None:
+                self._write_kpis(kpis)
+    
+    def _start_io_thread(self):
+        """Start the background writer thread."""
+        self._io_queue = queue.Queue(maxsize=IO_QUEUE_SIZE)
+        self._io_thread = threading.Thread(target=self._io_worker, name="energy-monitor-io", daemon=True)
+        self._io_thread.start()
+    
+    def _stop_io_thread(self):
+        """Flush pending writes and stop the background writer thread."""
+        if self._io_thread is not None:
+            self._io_queue.put(None)
+            self._io_thread.join()
+            self._io_thread = None
+            self._io_queue = None
+    
+    def _submit_io(self, csv_job, kpis, block: bool = False):
+        """Queue a tick's writes, dropping the oldest pending tick if the writer is behind.
+        
+        block waits for room instead, for the last flush that no later tick could repair.
+        """
+        item = (csv_job, kpis)
+        if block:
+            self._io_queue.put(item)
+            return
+        try:
+            self._io_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._io_queue.get_nowait()
+            except queue.Empty:
+                pass
+            # The dropped tick never reached the CSV, so rebuild it from the buffer next tick
+            self._csv_initialized = False
+            self._io_queue.put_nowait(item)
+    
+    def _flush(self, final: bool = False):
+        """Hand the rows recorded since the last flush, plus fresh KPIs, to the writer thread."""
+        csv_job = self._prepare_csv_write(final)
+        try:
+            kpis = self._compute_kpis()
+        except Exception as e:
+            print(f"Error updating KPIs: {e}")
+            kpis = None
+        self._submit_io(csv_job, kpis, block=final)
+    
+    def start_monitoring(self, interval: float = 2.0, flush_every: int = 1):
+        """Start continuous monitoring.
+        
+        Args:
+            interval: Seconds between generated data points
+            flush_every: Write files every N ticks (rows are batched in between);
+                ticks still pending when monitoring stops are written on shutdown
+        """
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be at least 1, got {flush_every}")
+        
         print(f"🚀 Starting Continuous Real-Time Energy Monitor")
         print(f"📊 Generating data every {interval} seconds")
         print(f"📁 Output directory: {self.output_dir}")
@@ -236,21 +572,21 @@ class ContinuousEnergyMonitor:
         print(f"⏹️  Press Ctrl+C to stop")
         print("-" * 60)
         
+        # File I/O runs on a background thread so slow disks don't delay the next tick
+        self._start_io_thread()
+        
         try:
             while self.running:
                 # Generate new data point
-                data_points = self._generate_data_point()
+                data_points, (total_power, active_hosts, total_containers) = self._generate_data_point()
                 
-                # Update files
-                self._update_csv(data_points)
-                self._update_kpis()
+                # Hand the file updates to the writer thread every flush_every ticks
+                self._record_tick(data_points)
+                if self._tick_count % flush_every == 0:
+                    self._flush()
                 
                 # Print status
-                current_time = datetime.now().strftime("%H:%M:%S")
-                total_power = sum(dp['power_watts'] for dp in data_points)
-                active_hosts = sum(1 for dp in data_points if dp['state'] == 'active')
-                total_containers = sum(dp['active_containers'] for dp in data_points)
-                
+                current_time = time.strftime("%H:%M:%S")
                 print(f"[{current_time}] Power: {total_power:.0f}W | Hosts: {active_hosts}/5 | Containers: {total_containers} | Data Points: {self.data_points}")
                 
                 # Wait for next update
@@ -262,6 +598,12 @@ class ContinuousEnergyMonitor:
             print(f"❌ Error in monitoring: {e}")
         finally:
             self.running = False
+            # Write the ticks recorded since the last flush, and a JSON snapshot
+            # matching the CSV (it is only written every few flushes), before the writer stops
+            if self._tick_count:
+                self._flush(final=True)
+            self._stop_io_thread()
+            self._close_csv()
     
     def stop_monitoring(self):
         """Stop monitoring."""
@@ -269,14 +611,18 @@ class ContinuousEnergyMonitor:
 
 
 def signal_handler(signum, frame):
-    """Handle Ctrl+C gracefully."""
+    """Handle Ctrl+C and SIGTERM gracefully."""
+    # Ignore repeats (e.g. Ctrl+C followed by the launcher's own SIGINT) so the final flush isn't cut short
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
     print("\n🛑 Received interrupt signal. Stopping monitor...")
     sys.exit(0)
 
 
 if __name__ == "__main__":
-    # Set up signal handler
+    # Set up signal handlers (the launcher stops the monitor with SIGINT, other tools with SIGTERM)
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
     # Create and start monitor
     monitor = ContinuousEnergyMonitor()
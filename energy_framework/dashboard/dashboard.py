@@ -24,11 +24,7 @@ import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import io
-from openpyxl import Workbook
-from openpyxl.chart import LineChart, BarChart, Reference
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')
+import hashlib
 
 # Timezone support for Sri Lanka (Colombo) - UTC+5:30
 try:
@@ -44,6 +40,34 @@ except ImportError:
         from datetime import timedelta, timezone
         SRI_LANKA_TZ = timezone(timedelta(hours=5, minutes=30))
 
+# Use the multi-threaded PyArrow CSV parser for the energy log when available
+try:
+    import pyarrow
+    CSV_READ_OPTIONS = {'engine': 'pyarrow'}
+except ImportError:
+    CSV_READ_OPTIONS = {'low_memory': False}
+
+# The monitor keeps these metrics as float32/int16 and writes about float32
+# precision, so parse them as 32-bit to halve the bytes every chart and
+# aggregate scans (timestamp stays float64; missing columns are ignored)
+CSV_DTYPES = {
+    'cpu_utilization': 'float32',
+    'memory_utilization': 'float32',
+    'ram_gb': 'float32',
+    'power_watts': 'float32',
+    'temperature_c': 'float32',
+    'latency_ms': 'float32',
+    'throughput_mbps': 'float32',
+    'cores': 'int32',
+    'active_containers': 'int32',
+}
+
+# Use the compiled LTTB downsampler for chart series when available
+try:
+    from tsdownsample import LTTBDownsampler
+except ImportError:
+    LTTBDownsampler = None
+
 
 def get_sri_lanka_time():
     """Get current time in Sri Lanka (Colombo) timezone."""
@@ -55,20 +79,136 @@ def format_sri_lanka_time(dt, format_str="%Y-%m-%d %H:%M:%S"):
     if dt is None:
         return "N/A"
     
-    # If datetime is timezone-naive, assume it's UTC and convert
+    # If datetime is timezone-naive, assume it's UTC. pandas Timestamps
+    # support the same replace/astimezone calls, so one path serves both
     if dt.tzinfo is None:
-        if isinstance(dt, pd.Timestamp):
-            dt = dt.tz_localize('UTC')
-        else:
-            dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=timezone.utc)
     
-    # Convert to Sri Lanka timezone
-    if isinstance(dt, pd.Timestamp):
-        dt_sl = dt.tz_convert('Asia/Colombo')
-    else:
-        dt_sl = dt.astimezone(SRI_LANKA_TZ)
-    
-    return dt_sl.strftime(format_str)
+    return dt.astimezone(SRI_LANKA_TZ).strftime(format_str)
+
+
+# Bytes read from the start of the log to fingerprint its header and first row
+LOG_FINGERPRINT_HEAD = 4096
+
+# Most points sent to the browser per time-series trace (roughly one per pixel column)
+MAX_CHART_POINTS = 2000
+
+# Time-series display windows offered in the sidebar (minutes; None = everything)
+DISPLAY_WINDOWS = {
+    'Last 15 minutes': 15,
+    'Last hour': 60,
+    'Last 6 hours': 360,
+    'All data': None,
+}
+
+
+def data_version(df: pd.DataFrame) -> tuple:
+    """Identify the loaded log's contents by row count and newest timestamp."""
+    return (len(df), df['timestamp'].iloc[-1] if len(df) > 0 else None)
+
+
+def window_view(df: pd.DataFrame, minutes: int = None) -> pd.DataFrame:
+    """Return the rows from the last `minutes` of the log (all rows if None)."""
+    if minutes is None or df.empty:
+        return df
+    
+    times = df['datetime']
+    window = pd.Timedelta(minutes=minutes)
+    if times.is_monotonic_increasing:
+        # Time-ordered log: binary search for the first row inside the window
+        return df.iloc[times.searchsorted(times.iloc[-1] - window):]
+    return df[times >= times.max() - window]
+
+
+def latest_per_host(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the most recent row of each host, ordered by host_id.
+    
+    The result is kept in session state for the current data version, so
+    the groupby only reruns when new rows have been loaded.
+    """
+    version = data_version(df)
+    cached = st.session_state.get('latest_per_host')
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    latest = df.loc[df.groupby('host_id', observed=True)['timestamp'].idxmax()].reset_index(drop=True)
+    st.session_state['latest_per_host'] = (version, latest)
+    return latest
+
+
+def cached_figure(chart_id: str, df: pd.DataFrame, build):
+    """Return build()'s figure, reusing the previous one while the data is unchanged.
+    
+    Figures are kept in session state keyed by chart_id together with the data
+    version (row count and newest timestamp), so reruns that see no new rows
+    skip building the Plotly figure again.
+    """
+    version = data_version(df)
+    cache = st.session_state.setdefault('figure_cache', {})
+    cached = cache.get(chart_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    fig = build()
+    cache[chart_id] = (version, fig)
+    return fig
+
+
+def total_by_time(df: pd.DataFrame, column: str = 'power_watts') -> pd.DataFrame:
+    """Sum a column across hosts for each sample time (one row per time)."""
+    times = df['datetime']
+    if df.empty or not times.is_monotonic_increasing:
+        return df.groupby('datetime')[column].sum().reset_index()
+    
+    # The log is written in time order, so each sample time is a contiguous
+    # run of rows: sum the runs in one linear pass instead of a hashed groupby
+    values = times.values
+    starts = np.flatnonzero(np.append(True, values[1:] != values[:-1]))
+    return pd.DataFrame({
+        'datetime': times.iloc[starts].reset_index(drop=True),
+        column: np.add.reduceat(df[column].to_numpy(), starts),
+    })
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out row positions with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the mean of the next bucket, which preserves the visual shape of the line.
+    """
+    n = len(x)
+    if LTTBDownsampler is not None:
+        return LTTBDownsampler().downsample(x, y, n_out=n_out)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the following bucket (just the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def downsample_series(df: pd.DataFrame, y: str, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """Thin a time-ordered frame to max_points rows for plotting (LTTB)."""
+    if len(df) <= max_points:
+        return df
+    
+    x = df['datetime'].astype('int64').to_numpy(dtype=float)
+    values = np.nan_to_num(df[y].to_numpy(dtype=float))
+    return df.iloc[np.sort(lttb_indices(x, values, max_points))]
 
 # Page configuration
 st.set_page_config(
@@ -161,11 +301,193 @@ class DashboardDataLoader:
             self.output_dir = Path(output_dir)
         
         self.csv_path = self.output_dir / "energy_log.csv"
+        self.parquet_path = self.csv_path.with_suffix('.parquet')
         self.json_path = self.output_dir / "energy_log.json"
         self.kpis_path = self.output_dir / "reports" / "kpis.json"
     
-    def load_csv_data(_self, force_reload: bool = False) -> pd.DataFrame:
-        """Load energy log CSV without caching to show real-time data."""
+    def _read_new_rows(self, offset: int = 0, columns: list = None):
+        """Read the complete CSV rows written from byte offset onwards.
+        
+        Returns the rows (None if there are none) and the offset just past the
+        last complete line; a partially written line is left for the next read.
+        """
+        with open(self.csv_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return None, offset
+        
+        buf = io.BytesIO(data[:end])
+        if columns is None:
+            # Reading from the start: the first line is the header
+            df = pd.read_csv(buf, dtype=CSV_DTYPES, **CSV_READ_OPTIONS)
+        else:
+            df = pd.read_csv(buf, header=None, names=columns, dtype=CSV_DTYPES, **CSV_READ_OPTIONS)
+        return df, offset + end
+    
+    def _log_fingerprint(self) -> str:
+        """Fingerprint the log by its header and first data row.
+        
+        The first row carries its timestamp, so a different log that reused
+        the inode (and is at least as long) no longer matches, while
+        appended rows don't change it.
+        """
+        with open(self.csv_path, 'rb') as f:
+            head = f.read(LOG_FINGERPRINT_HEAD)
+        
+        # Header plus first data row (everything read if it has no second newline)
+        head_end = head.find(b'\n', head.find(b'\n') + 1) + 1
+        return hashlib.blake2b(head[:head_end or len(head)], digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _prepare_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Parse datetimes and normalize columns of freshly read CSV rows."""
+        # Parse datetime and convert to Sri Lanka timezone in one pass
+        # (utc=True treats timezone-naive values as UTC)
+        df['datetime'] = pd.to_datetime(
+            df['datetime'], utc=True, format='ISO8601', cache=True
+        ).dt.tz_convert(SRI_LANKA_TZ)
+        
+        # Rename columns to match expected format
+        if 'cores' in df.columns:
+            df = df.rename(columns={'cores': 'cpu_cores'})
+        if 'ram_gb' in df.columns:
+            df = df.rename(columns={'ram_gb': 'memory_gb'})
+        if 'temperature_c' in df.columns:
+            df = df.rename(columns={'temperature_c': 'temperature_celsius'})
+        
+        # Group and compare hosts by fixed-width category codes, not strings
+        df['host_id'] = df['host_id'].astype('category')
+        
+        # Handle missing latency and throughput columns
+        if 'latency_ms' not in df.columns:
+            df['latency_ms'] = np.nan
+        if 'throughput_mbps' not in df.columns:
+            df['throughput_mbps'] = np.nan
+        
+        return df
+    
+    @staticmethod
+    def _append_rows(df: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+        """Append parsed rows, keeping host_id categorical.
+        
+        pd.concat only keeps a categorical column when both sides share the
+        same categories, so new hosts are added to the existing categories
+        (codes unchanged) and the delta is recoded against them.
+        """
+        hosts = df['host_id'].cat.categories
+        new_hosts = delta['host_id'].cat.categories.difference(hosts)
+        if len(new_hosts) > 0:
+            df['host_id'] = df['host_id'].cat.add_categories(new_hosts)
+            hosts = df['host_id'].cat.categories
+        delta['host_id'] = delta['host_id'].cat.set_categories(hosts)
+        return pd.concat([df, delta], ignore_index=True)
+    
+    def _load_parquet_cache(self, stat):
+        """Restore the parsed log from the Parquet snapshot if it matches the CSV.
+        
+        The snapshot records the CSV inode, the byte offset it was parsed up
+        to and a fingerprint of the content before that offset; it is only
+        used while the monitor is still appending to that same file (inode
+        numbers alone get reused when the log is rotated). Returns a csv_cache
+        dict, or None if there is no usable snapshot.
+        """
+        if not self.parquet_path.exists():
+            return None
+        try:
+            df = pd.read_parquet(self.parquet_path)
+        except Exception:
+            # No Parquet engine installed or an unreadable snapshot - parse the CSV
+            return None
+        
+        meta = df.attrs.get('energy_log')
+        df.attrs = {}
+        if (
+            not meta or
+            meta['inode'] != stat.st_ino or
+            meta['offset'] > stat.st_size or
+            meta.get('fingerprint') != self._log_fingerprint()
+        ):
+            return None
+        return {
+            'inode': meta['inode'],
+            'offset': meta['offset'],
+            'fingerprint': meta['fingerprint'],
+            'columns': meta['columns'],
+            'df': df,
+        }
+    
+    def _save_parquet_cache(self, cache: dict):
+        """Write the freshly parsed log to a Parquet snapshot next to the CSV."""
+        snapshot = cache['df'].copy(deep=False)
+        snapshot.attrs = {'energy_log': {
+            'inode': cache['inode'],
+            'offset': cache['offset'],
+            'fingerprint': cache['fingerprint'],
+            'columns': cache['columns'],
+        }}
+        try:
+            snapshot.to_parquet(self.parquet_path, compression='zstd')
+        except Exception:
+            # Snapshot is only an optimization (e.g. pyarrow missing, read-only dir)
+            pass
+    
+    def _read_csv_incremental(self, stat, force_reload: bool = False) -> pd.DataFrame:
+        """Return the parsed log, parsing only rows appended since the last rerun.
+        
+        The parsed frame and the byte offset read up to are kept in session
+        state. The monitor appends to the log and periodically compacts it by
+        swapping in a rewritten file, so a new inode, a shrunk file or a
+        content fingerprint mismatch means the whole log is read again.
+        The fingerprint is only checked when the log has grown, since an
+        unchanged stat() needs no read at all.
+        """
+        cache = st.session_state.get('csv_cache')
+        full_read = (
+            force_reload or
+            cache is None or
+            cache['inode'] != stat.st_ino or
+            stat.st_size < cache['offset'] or
+            (stat.st_size > cache['offset'] and cache['fingerprint'] != self._log_fingerprint())
+        )
+        
+        if full_read:
+            # A new session starts from the Parquet snapshot when it still
+            # matches the log, so only rows appended since then are parsed
+            cache = None if force_reload else self._load_parquet_cache(stat)
+            if cache is None:
+                raw, offset = self._read_new_rows()
+                if raw is None:
+                    st.session_state.pop('csv_cache', None)
+                    return pd.DataFrame()
+                cache = {
+                    'inode': stat.st_ino,
+                    'offset': offset,
+                    'fingerprint': self._log_fingerprint(),
+                    'columns': list(raw.columns),
+                    'df': self._prepare_rows(raw),
+                }
+                self._save_parquet_cache(cache)
+            st.session_state['csv_cache'] = cache
+        
+        if stat.st_size > cache['offset']:
+            # Only parse the appended byte range and convert just those rows
+            delta, cache['offset'] = self._read_new_rows(cache['offset'], cache['columns'])
+            if delta is not None and len(delta) > 0:
+                delta = self._prepare_rows(delta)
+                cache['df'] = self._append_rows(cache['df'], delta)
+        
+        return cache['df']
+    
+    def load_csv_data(_self, force_reload: bool = False, show_status: bool = True) -> pd.DataFrame:
+        """Load energy log CSV, re-parsing only new rows to show real-time data.
+        
+        show_status=True writes freshness/status messages to the current
+        container (the sidebar data status fragment); show_status=False skips
+        them for callers that only need the data.
+        """
         try:
             # Initialize session state for tracking file modifications
             if 'last_file_mtime' not in st.session_state:
@@ -178,8 +500,9 @@ class DashboardDataLoader:
             
             if _self.csv_path.exists():
                 # Check file modification time and size to detect changes
-                file_mtime = os.path.getmtime(_self.csv_path)
-                file_size = os.path.getsize(_self.csv_path)
+                stat = os.stat(_self.csv_path)
+                file_mtime = stat.st_mtime
+                file_size = stat.st_size
                 time_since_update = time.time() - file_mtime
                 
                 # Detect if file has changed
@@ -189,49 +512,30 @@ class DashboardDataLoader:
                     file_size != st.session_state.get('last_file_size')
                 )
                 
-                # Update session state
-                st.session_state['last_file_mtime'] = file_mtime
-                st.session_state['last_file_size'] = file_size
+                # Update session state (the change icon is only shown with the status)
+                if show_status:
+                    st.session_state['last_file_mtime'] = file_mtime
+                    st.session_state['last_file_size'] = file_size
                 
-                # Read CSV file - always read fresh (no caching)
-                # Use low_memory=False to ensure we get all data
-                df = pd.read_csv(_self.csv_path, low_memory=False)
+                # Read CSV file - only rows appended since the last rerun are parsed
+                df = _self._read_csv_incremental(stat, force_reload)
                 
-                if len(df) > 0:
-                    # Parse datetime and convert to Sri Lanka timezone
-                    df['datetime'] = pd.to_datetime(df['datetime'])
-                    # If datetime is timezone-naive, assume UTC and convert to Sri Lanka time
-                    if df['datetime'].dt.tz is None:
-                        df['datetime'] = df['datetime'].dt.tz_localize('UTC')
-                    df['datetime'] = df['datetime'].dt.tz_convert('Asia/Colombo')
-                    
-                    # Rename columns to match expected format
-                    if 'cores' in df.columns:
-                        df = df.rename(columns={'cores': 'cpu_cores'})
-                    if 'ram_gb' in df.columns:
-                        df = df.rename(columns={'ram_gb': 'memory_gb'})
-                    if 'temperature_c' in df.columns:
-                        df = df.rename(columns={'temperature_c': 'temperature_celsius'})
-                    
-                    # Handle missing latency and throughput columns
-                    if 'latency_ms' not in df.columns:
-                        df['latency_ms'] = np.nan
-                    if 'throughput_mbps' not in df.columns:
-                        df['throughput_mbps'] = np.nan
-                    
+                if len(df) > 0 and not show_status:
+                    return df
+                elif len(df) > 0:
                     # Show data freshness indicator with change status
                     status_icon = "🔄" if file_changed else "✅"
                     if time_since_update < 5:
-                        st.sidebar.success(f"{status_icon} Loaded {len(df)} data points (LIVE - {int(time_since_update)}s ago)")
+                        st.success(f"{status_icon} Loaded {len(df)} data points (LIVE - {int(time_since_update)}s ago)")
                     elif time_since_update < 30:
-                        st.sidebar.info(f"{status_icon} Loaded {len(df)} data points ({int(time_since_update)}s ago)")
+                        st.info(f"{status_icon} Loaded {len(df)} data points ({int(time_since_update)}s ago)")
                     else:
-                        st.sidebar.warning(f"⚠️ Loaded {len(df)} data points (STALE - {int(time_since_update)}s ago)")
+                        st.warning(f"⚠️ Loaded {len(df)} data points (STALE - {int(time_since_update)}s ago)")
                     
                     # Show latest timestamp in Sri Lanka timezone
                     latest_time = df['datetime'].iloc[-1]
                     latest_time_str = format_sri_lanka_time(latest_time, '%Y-%m-%d %H:%M:%S')
-                    st.sidebar.write(f"**Latest Data:** {latest_time_str} (SLT)")
+                    st.write(f"**Latest Data:** {latest_time_str} (SLT)")
                     
                     # Store in session state for comparison
                     st.session_state['last_df_size'] = len(df)
@@ -239,25 +543,28 @@ class DashboardDataLoader:
                     
                     return df
                 else:
-                    st.sidebar.warning("⚠️ CSV file is empty")
+                    if show_status:
+                        st.warning("⚠️ CSV file is empty")
                     return _self._generate_sample_data()
             else:
-                st.sidebar.warning("⚠️ CSV file not found, using sample data")
-                st.sidebar.write(f"**Expected path:** {csv_abs_path}")
+                if show_status:
+                    st.warning("⚠️ CSV file not found, using sample data")
+                    st.write(f"**Expected path:** {csv_abs_path}")
                 return _self._generate_sample_data()
         except Exception as e:
-            st.sidebar.error(f"❌ Error loading CSV: {e}")
-            import traceback
-            st.sidebar.error(f"**Traceback:** {traceback.format_exc()}")
-            st.sidebar.warning("⚠️ Falling back to sample data")
+            if show_status:
+                st.error(f"❌ Error loading CSV: {e}")
+                import traceback
+                st.error(f"**Traceback:** {traceback.format_exc()}")
+                st.warning("⚠️ Falling back to sample data")
             return _self._generate_sample_data()
     
     def load_kpis(_self) -> dict:
-        """Load KPIs from JSON."""
+        """Load KPIs from JSON (re-parsed only when the file changes)."""
         try:
             if _self.kpis_path.exists():
-                with open(_self.kpis_path, 'r') as f:
-                    return json.load(f)
+                mtime_ns = os.stat(_self.kpis_path).st_mtime_ns
+                return _read_kpis(str(_self.kpis_path), mtime_ns)
             else:
                 return {}
         except Exception as e:
@@ -266,30 +573,43 @@ class DashboardDataLoader:
     
     def _generate_sample_data(self) -> pd.DataFrame:
         """Generate sample data for demo purposes."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         timestamps = pd.date_range(start='2025-01-01', periods=50, freq='10s')
-        
-        data = []
-        for i, ts in enumerate(timestamps):
-            for host_id in ['host-001', 'host-002', 'host-003', 'host-004', 'host-005']:
-                data.append({
-                    'timestamp': ts.timestamp(),
-                    'datetime': ts,
-                    'host_id': host_id,
-                    'cpu_utilization': np.random.uniform(0.3, 0.9),
-                    'memory_utilization': np.random.uniform(0.4, 0.8),
-                    'cpu_cores': 8,
-                    'memory_gb': 16.0,
-                    'power_watts': np.random.uniform(100, 250),
-                    'temperature_celsius': np.random.uniform(50, 80),
-                    'active_containers': np.random.randint(0, 5),
-                    'state': 'active' if np.random.random() > 0.2 else 'shutdown',
-                    'is_idle': False,
-                    'latency_ms': np.random.uniform(10, 60),
-                    'throughput_mbps': np.random.uniform(100, 500)
-                })
-        
-        return pd.DataFrame(data)
+        hosts = ['host-001', 'host-002', 'host-003', 'host-004', 'host-005']
+        
+        # One row per (timestamp, host), each column drawn in a single call
+        n = len(timestamps) * len(hosts)
+        datetimes = timestamps.repeat(len(hosts))
+        
+        return pd.DataFrame({
+            'timestamp': (datetimes - pd.Timestamp(0)) / pd.Timedelta(seconds=1),
+            'datetime': datetimes,
+            'host_id': pd.Categorical(np.tile(hosts, len(timestamps))),
+            'cpu_utilization': rng.uniform(0.3, 0.9, n),
+            'memory_utilization': rng.uniform(0.4, 0.8, n),
+            'cpu_cores': 8,
+            'memory_gb': 16.0,
+            'power_watts': rng.uniform(100, 250, n),
+            'temperature_celsius': rng.uniform(50, 80, n),
+            'active_containers': rng.integers(0, 5, n),
+            'state': np.where(rng.random(n) > 0.2, 'active', 'shutdown'),
+            'is_idle': False,
+            'latency_ms': rng.uniform(10, 60, n),
+            'throughput_mbps': rng.uniform(100, 500, n)
+        })
+
+
+@st.cache_resource
+def get_data_loader(output_dir: str = None) -> DashboardDataLoader:
+    """Return the data loader, created once and shared across reruns."""
+    return DashboardDataLoader(output_dir)
+
+
+@st.cache_data(show_spinner=False)
+def _read_kpis(path: str, mtime_ns: int) -> dict:
+    """Parse the KPI file; mtime_ns is part of the cache key so edits invalidate it."""
+    with open(path, 'r') as f:
+        return json.load(f)
 
 
 def render_header():
@@ -302,43 +622,34 @@ def render_header():
     ''', unsafe_allow_html=True)
 
 
-def render_sidebar(data_loader: DashboardDataLoader):
-    """Render sidebar with controls and settings."""
+def render_sidebar():
+    """Render sidebar with controls and settings.
+    
+    Returns the auto-refresh settings plus the two sidebar slots that the
+    live status fragments render into (see render_live_status and
+    render_data_status), so those parts refresh on the dashboard's timer.
+    """
     with st.sidebar:
         st.image("https://via.placeholder.com/150x150/2ecc71/ffffff?text=Energy+Framework", 
                  use_column_width=True)
         
         st.markdown("## ⚙️ Dashboard Controls")
         
-        # Real-time status with full timestamp and update counter
-        st.markdown("### 🟢 Real-Time Status")
-        
-        # Initialize refresh counter in session state
-        if 'refresh_count' not in st.session_state:
-            st.session_state['refresh_count'] = 0
-        if 'last_refresh_time' not in st.session_state:
-            st.session_state['last_refresh_time'] = get_sri_lanka_time()
-        
-        # Increment refresh counter on each page load
-        st.session_state['refresh_count'] = st.session_state.get('refresh_count', 0) + 1
-        st.session_state['last_refresh_time'] = get_sri_lanka_time()
-        
-        current_time = get_sri_lanka_time().strftime("%Y-%m-%d %H:%M:%S")
-        refresh_count = st.session_state['refresh_count']
-        last_refresh = st.session_state['last_refresh_time'].strftime("%H:%M:%S")
-        
-        st.markdown(f"""
-        <div style="text-align: center; padding: 10px; background: rgba(46, 204, 113, 0.1); border-radius: 5px; margin: 10px 0;">
-            <span style="color: #2ecc71; font-weight: bold; font-size: 18px;">🟢 LIVE</span><br>
-            <span class="live-clock" style="color: #ecf0f1; font-size: 12px; font-family: monospace;">Loading...</span><br>
-            <span style="color: #95a5a6; font-size: 11px;">Updates: {refresh_count} | Last: {last_refresh}</span>
-        </div>
-        """, unsafe_allow_html=True)
+        # Real-time status (clock and update counter), filled by render_live_status
+        live_status_slot = st.container()
         
         # Refresh settings
         st.markdown("### 🔄 Refresh Settings")
         auto_refresh = st.checkbox("Auto-refresh", value=True)
         refresh_interval = st.slider("Refresh interval (seconds)", 1, 10, 2, help="How often the dashboard automatically updates (1-10 seconds)")
+        st.checkbox("Show host debug table", value=False, key='debug', help="List the latest per-host values the tabs are using")
+        st.selectbox(
+            "Display window",
+            list(DISPLAY_WINDOWS),
+            index=len(DISPLAY_WINDOWS) - 1,
+            key='display_window',
+            help="How much history the time-series charts show (KPIs and totals always use all data)"
+        )
         
         if st.button("🔄 Refresh Now", use_container_width=True):
             # Clear all caches and force reload
@@ -348,8 +659,8 @@ def render_sidebar(data_loader: DashboardDataLoader):
                 del st.session_state['last_file_mtime']
             if 'last_file_size' in st.session_state:
                 del st.session_state['last_file_size']
-            if 'file_check_mtime' in st.session_state:
-                del st.session_state['file_check_mtime']
+            if 'csv_cache' in st.session_state:
+                del st.session_state['csv_cache']
             st.rerun()
         
         if st.button("🗑️ Clear Cache & Reload", use_container_width=True):
@@ -360,8 +671,8 @@ def render_sidebar(data_loader: DashboardDataLoader):
                 del st.session_state['last_file_mtime']
             if 'last_file_size' in st.session_state:
                 del st.session_state['last_file_size']
-            if 'file_check_mtime' in st.session_state:
-                del st.session_state['file_check_mtime']
+            if 'csv_cache' in st.session_state:
+                del st.session_state['csv_cache']
             if 'last_df_size' in st.session_state:
                 del st.session_state['last_df_size']
             if 'last_df_timestamp' in st.session_state:
@@ -371,30 +682,8 @@ def render_sidebar(data_loader: DashboardDataLoader):
         
         st.markdown("---")
         
-        # Data status with debug info
-        st.markdown("### 📊 Data Status")
-        csv_exists = data_loader.csv_path.exists()
-        st.write(f"**CSV Log:** {'✅ Found' if csv_exists else '⚠️ Sample Data'}")
-        
-        if csv_exists:
-            file_size = os.path.getsize(data_loader.csv_path) / 1024
-            st.write(f"**File Size:** {file_size:.2f} KB")
-            mod_time = datetime.fromtimestamp(os.path.getmtime(data_loader.csv_path), tz=timezone.utc)
-            mod_time_sl = format_sri_lanka_time(mod_time, '%H:%M:%S')
-            st.write(f"**Last Updated:** {mod_time_sl} (SLT)")
-            
-            # Show data preview
-            try:
-                df = pd.read_csv(data_loader.csv_path)
-                st.write(f"**Data Points:** {len(df)}")
-                latest_dt = df['datetime'].iloc[-1] if len(df) > 0 else None
-                latest_time_str = format_sri_lanka_time(latest_dt, '%H:%M:%S') if latest_dt is not None else 'N/A'
-                st.write(f"**Latest Time:** {latest_time_str} (SLT)")
-                st.write(f"**Total Power:** {df['power_watts'].sum():.0f}W" if len(df) > 0 else "N/A")
-            except Exception as e:
-                st.write(f"**Error:** {str(e)}")
-        
-        st.markdown("---")
+        # Data status and debug info, filled by render_data_status
+        data_status_slot = st.container()
         
         # Info
         st.markdown("### ℹ️ About")
@@ -419,10 +708,94 @@ def render_sidebar(data_loader: DashboardDataLoader):
         if st.button("📊 Export to Excel with Graphs", use_container_width=True):
             st.session_state['export_excel'] = True
         
-        return auto_refresh, refresh_interval
+        return auto_refresh, refresh_interval, live_status_slot, data_status_slot
 
 
-def render_metrics_overview(df: pd.DataFrame, kpis: dict):
+def render_live_status():
+    """Render the sidebar's live clock and update counter (run as a fragment)."""
+    # Real-time status with full timestamp and update counter
+    st.markdown("### 🟢 Real-Time Status")
+    
+    # Count every refresh of the live parts of the page
+    st.session_state['refresh_count'] = st.session_state.get('refresh_count', 0) + 1
+    st.session_state['last_refresh_time'] = get_sri_lanka_time()
+    
+    current_time = st.session_state['last_refresh_time'].strftime("%Y-%m-%d %H:%M:%S")
+    refresh_count = st.session_state['refresh_count']
+    last_refresh = st.session_state['last_refresh_time'].strftime("%H:%M:%S")
+    
+    st.markdown(f"""
+    <div style="text-align: center; padding: 10px; background: rgba(46, 204, 113, 0.1); border-radius: 5px; margin: 10px 0;">
+        <span style="color: #2ecc71; font-weight: bold; font-size: 18px;">🟢 LIVE</span><br>
+        <span class="live-clock" style="color: #ecf0f1; font-size: 12px; font-family: monospace;">{current_time} (SLT)</span><br>
+        <span style="color: #95a5a6; font-size: 11px;">Updates: {refresh_count} | Last: {last_refresh}</span>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render_data_status(data_loader: DashboardDataLoader):
+    """Render the sidebar's data freshness, file status and debug info (run as a fragment)."""
+    # Only rows appended since the last run are parsed
+    df = data_loader.load_csv_data(show_status=True)
+    
+    # Data status with debug info
+    st.markdown("### 📊 Data Status")
+    csv_exists = data_loader.csv_path.exists()
+    st.write(f"**CSV Log:** {'✅ Found' if csv_exists else '⚠️ Sample Data'}")
+    
+    if csv_exists:
+        stat = os.stat(data_loader.csv_path)
+        file_size = stat.st_size / 1024
+        st.write(f"**File Size:** {file_size:.2f} KB")
+        mod_time = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        mod_time_sl = format_sri_lanka_time(mod_time, '%H:%M:%S')
+        st.write(f"**Last Updated:** {mod_time_sl} (SLT)")
+        
+        # Show data preview from the already loaded log
+        try:
+            st.write(f"**Data Points:** {len(df)}")
+            latest_dt = df['datetime'].iloc[-1] if len(df) > 0 else None
+            latest_time_str = format_sri_lanka_time(latest_dt, '%H:%M:%S') if latest_dt is not None else 'N/A'
+            st.write(f"**Latest Time:** {latest_time_str} (SLT)")
+            st.write(f"**Total Power:** {df['power_watts'].to_numpy().sum():.0f}W" if len(df) > 0 else "N/A")
+        except Exception as e:
+            st.write(f"**Error:** {str(e)}")
+        
+        # Note when the log last changed
+        current_mtime = stat.st_mtime
+        last_check_mtime = st.session_state.get('check_mtime', 0)
+        if current_mtime != last_check_mtime:
+            st.session_state['check_mtime'] = current_mtime
+            if current_mtime > last_check_mtime:
+                update_time = datetime.fromtimestamp(current_mtime, tz=timezone.utc)
+                update_time_str = format_sri_lanka_time(update_time, '%H:%M:%S')
+                st.success(f"🔄 Data updated at {update_time_str} (SLT)")
+    
+    st.markdown("---")
+    
+    # Debug: Show what data we're actually loading
+    if not df.empty:
+        st.markdown("### 🔍 Debug Info")
+        st.write(f"**Data Points:** {len(df)}")
+        latest_dt_debug = df['datetime'].iloc[-1]
+        latest_time_debug_str = format_sri_lanka_time(latest_dt_debug, '%Y-%m-%d %H:%M:%S')
+        st.write(f"**Latest Time:** {latest_time_debug_str} (SLT)")
+        st.write(f"**Total Power:** {df['power_watts'].sum():.0f}W")
+        st.write(f"**Hosts:** {df['host_id'].nunique()}")
+        st.write(f"**Containers:** {df['active_containers'].sum()}")
+        st.markdown("---")
+        
+        # Debug: Show what host data the tabs are using, as one table
+        if st.session_state.get('debug'):
+            st.markdown("### 🖥️ Host Data Debug")
+            st.dataframe(
+                latest_per_host(df)[['host_id', 'cpu_utilization', 'power_watts', 'active_containers']],
+                hide_index=True
+            )
+            st.markdown("---")
+
+
+def render_metrics_overview(df: pd.DataFrame, kpis: dict, latest: pd.DataFrame = None):
     """Render key metrics overview with real-time updates."""
     st.markdown("## 📊 System Overview")
     
@@ -445,19 +818,20 @@ def render_metrics_overview(df: pd.DataFrame, kpis: dict):
     </div>
     """, unsafe_allow_html=True)
     
-    # Add a live timestamp that updates with JavaScript
+    # Live timestamp, refreshed server-side each time the tabs fragment reruns
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.markdown("""
+        st.markdown(f"""
         <div style="text-align: center; padding: 10px; background: rgba(46, 204, 113, 0.1); border-radius: 5px; margin: 10px 0;">
             <span style="color: #2ecc71; font-weight: bold; font-size: 16px;">🕐 LIVE TIMESTAMP</span><br>
-            <span class="live-clock" style="color: #ecf0f1; font-size: 14px; font-family: monospace;">Loading...</span>
+            <span class="live-clock" style="color: #ecf0f1; font-size: 14px; font-family: monospace;">{current_time} (SLT)</span>
         </div>
         """, unsafe_allow_html=True)
     
     # Get latest data and show data freshness
     if not df.empty:
-        latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()]
+        if latest is None:
+            latest = latest_per_host(df)
         
         # Show data freshness in Sri Lanka timezone
         latest_timestamp = df['datetime'].max()
@@ -468,25 +842,30 @@ def render_metrics_overview(df: pd.DataFrame, kpis: dict):
         </div>
         """, unsafe_allow_html=True)
         
-        # Calculate real-time metrics
-        total_power = latest['power_watts'].sum()
-        avg_cpu = latest['cpu_utilization'].mean() * 100
-        avg_memory = latest['memory_utilization'].mean() * 100
+        # Calculate real-time metrics from the latest row of each host
+        total_power = latest['power_watts'].to_numpy().sum()
+        avg_cpu = latest['cpu_utilization'].to_numpy().mean() * 100
+        avg_memory = latest['memory_utilization'].to_numpy().mean() * 100
         active_hosts = (latest['state'] == 'active').sum()
-        total_containers = latest['active_containers'].sum()
-        
-        # Calculate trends (compare with previous data point)
-        if len(df) > 1:
-            prev_data = df.groupby('host_id').nth(-2)
-            prev_power = prev_data['power_watts'].sum()
-            prev_cpu = prev_data['cpu_utilization'].mean() * 100
-            prev_memory = prev_data['memory_utilization'].mean() * 100
-            prev_containers = prev_data['active_containers'].sum()
-            
-            power_trend = total_power - prev_power
-            cpu_trend = avg_cpu - prev_cpu
-            memory_trend = avg_memory - prev_memory
-            container_trend = total_containers - prev_containers
+        total_containers = int(latest['active_containers'].to_numpy().sum())
+        
+        # Calculate trends against the totals of the previous data version,
+        # kept in session state so the log needn't be scanned for prior rows
+        current = (total_power, avg_cpu, avg_memory, total_containers)
+        version = data_version(df)
+        snapshot = st.session_state.get('overview_totals')
+        if snapshot is None:
+            previous = None
+        elif snapshot['version'] == version:
+            previous = snapshot['previous']
+        else:
+            previous = snapshot['current']
+        st.session_state['overview_totals'] = {'version': version, 'current': current, 'previous': previous}
+        
+        if previous is not None:
+            power_trend, cpu_trend, memory_trend, container_trend = (
+                now - before for now, before in zip(current, previous)
+            )
         else:
             power_trend = cpu_trend = memory_trend = container_trend = 0
         
@@ -568,7 +947,7 @@ def render_metrics_overview(df: pd.DataFrame, kpis: dict):
             )
 
 
-def render_host_overview(df: pd.DataFrame):
+def render_host_overview(df: pd.DataFrame, latest: pd.DataFrame = None):
     """Render detailed host status overview."""
     st.markdown("## 🖥️ Host Status Overview")
     
@@ -577,19 +956,15 @@ def render_host_overview(df: pd.DataFrame):
         return
     
     # Get latest data for each host (most recent timestamp)
-    latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()].reset_index(drop=True)
-    
-    # Debug: Show what data we're using
-    st.sidebar.markdown("### 🖥️ Host Data Debug")
-    for _, host in latest.iterrows():
-        st.sidebar.write(f"**{host['host_id']}**: CPU {host['cpu_utilization']*100:.1f}%, Power {host['power_watts']:.0f}W, Containers {host['active_containers']}")
-    st.sidebar.markdown("---")
+    if latest is None:
+        latest = latest_per_host(df)
     
     # Create columns for hosts
     num_hosts = len(latest)
     cols = st.columns(min(num_hosts, 3))
     
-    for idx, (_, host) in enumerate(latest.iterrows()):
+    # Plain dicts of Python scalars: no per-host Series is built as with iterrows()
+    for idx, host in enumerate(latest.to_dict(orient='records')):
         with cols[idx % 3]:
             # Determine status color based on state
             # ACTIVE = GREEN, NOT ACTIVE (shutdown/idle) = YELLOW/ORANGE
@@ -629,25 +1004,18 @@ def render_host_overview(df: pd.DataFrame):
             st.markdown("---")
 
 
-def render_energy_consumption(df: pd.DataFrame):
-    """Render energy consumption charts."""
-    st.markdown("## 💡 Energy Consumption Analysis")
-    
-    if df.empty:
-        st.warning("No data available")
-        return
-    
-    # Total power over time
-    power_by_time = df.groupby('datetime')['power_watts'].sum().reset_index()
+def build_cluster_power_figure(df: pd.DataFrame) -> go.Figure:
+    """Build the cluster power over time chart."""
+    power_by_time = downsample_series(total_by_time(df), 'power_watts')
     
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=power_by_time['datetime'],
         y=power_by_time['power_watts'],
         mode='lines+markers',
         name='Total Power',
-        line=dict(color='#2ecc71', width=3),
+        line=dict(color='#2ecc71', width=2),
         fill='tozeroy',
         fillcolor='rgba(46, 204, 113, 0.2)'
     ))
@@ -660,27 +1028,82 @@ def render_energy_consumption(df: pd.DataFrame):
         template='plotly_white',
         height=400
     )
+    return fig
+
+
+def build_host_power_figure(df: pd.DataFrame) -> go.Figure:
+    """Build the per-host power chart (active hosts only)."""
+    return build_host_trend_figure(df[df['state'] == 'active'], 'power_watts', 'Power Consumption per Host', 'Power (W)')
+
+
+def render_energy_consumption(df: pd.DataFrame):
+    """Render energy consumption charts."""
+    st.markdown("## 💡 Energy Consumption Analysis")
     
+    if df.empty:
+        st.warning("No data available")
+        return
+    
+    # Total power over time
+    fig = cached_figure('cluster_power', df, lambda: build_cluster_power_figure(df))
     st.plotly_chart(fig, use_container_width=True)
     
     # Power per host
     st.markdown("### Power Distribution by Host")
     
-    fig2 = px.line(
-        df[df['state'] == 'active'],
+    fig2 = cached_figure('host_power', df, lambda: build_host_power_figure(df))
+    st.plotly_chart(fig2, use_container_width=True)
+
+
+def build_container_bar_figure(latest: pd.DataFrame) -> go.Figure:
+    """Build the current containers-per-host bar chart."""
+    fig = px.bar(
+        latest,
+        x='host_id',
+        y='active_containers',
+        color='state',
+        title='Current Container Distribution',
+        labels={'active_containers': 'Containers', 'host_id': 'Host'},
+        color_discrete_map={'active': '#2ecc71', 'shutdown': '#f39c12', 'idle': '#f39c12'},  # Green for active, Orange/Yellow for shutdown/idle
+        template='plotly_white'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def build_container_pie_figure(latest: pd.DataFrame) -> go.Figure:
+    """Build the container share pie chart for active hosts."""
+    active_hosts = latest[latest['state'] == 'active']
+    fig = go.Figure(go.Pie(
+        values=active_hosts['active_containers'].to_numpy(),
+        labels=active_hosts['host_id'].to_numpy()
+    ))
+    fig.update_layout(title='Container Distribution (Active Hosts)', template='plotly_white', height=400)
+    return fig
+
+
+def build_container_timeline_figure(df: pd.DataFrame) -> go.Figure:
+    """Build the stacked container count timeline."""
+    # Each host logs one row per sample time, so the timeline is normally just
+    # these columns; only sum when sub-second ticks share a datetime
+    container_timeline = df[['datetime', 'host_id', 'active_containers']]
+    if container_timeline.duplicated(['datetime', 'host_id']).any():
+        container_timeline = container_timeline.groupby(['datetime', 'host_id'], sort=False, observed=True)['active_containers'].sum().reset_index()
+    
+    fig = px.area(
+        container_timeline,
         x='datetime',
-        y='power_watts',
+        y='active_containers',
         color='host_id',
-        title='Power Consumption per Host',
-        labels={'power_watts': 'Power (W)', 'datetime': 'Time'},
+        title='Container Count Timeline',
+        labels={'active_containers': 'Containers', 'datetime': 'Time'},
         template='plotly_white'
     )
-    
-    fig2.update_layout(height=400)
-    st.plotly_chart(fig2, use_container_width=True)
+    fig.update_layout(height=400)
+    return fig
 
 
-def render_container_distribution(df: pd.DataFrame):
+def render_container_distribution(df: pd.DataFrame, latest: pd.DataFrame = None):
     """Render container distribution charts."""
     st.markdown("## 📦 Container Distribution")
     
@@ -689,64 +1112,30 @@ def render_container_distribution(df: pd.DataFrame):
         return
     
     # Latest distribution
-    latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()].reset_index(drop=True)
+    if latest is None:
+        latest = latest_per_host(df)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Bar chart
-        fig = px.bar(
-            latest,
-            x='host_id',
-            y='active_containers',
-            color='state',
-            title='Current Container Distribution',
-            labels={'active_containers': 'Containers', 'host_id': 'Host'},
-            color_discrete_map={'active': '#2ecc71', 'shutdown': '#f39c12', 'idle': '#f39c12'},  # Green for active, Orange/Yellow for shutdown/idle
-            template='plotly_white'
-        )
-        fig.update_layout(height=400)
+        fig = cached_figure('container_bar', df, lambda: build_container_bar_figure(latest))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Pie chart
-        active_hosts = latest[latest['state'] == 'active']
-        fig2 = px.pie(
-            active_hosts,
-            values='active_containers',
-            names='host_id',
-            title='Container Distribution (Active Hosts)',
-            template='plotly_white'
-        )
-        fig2.update_layout(height=400)
+        fig2 = cached_figure('container_pie', df, lambda: build_container_pie_figure(latest))
         st.plotly_chart(fig2, use_container_width=True)
     
     # Timeline
     st.markdown("### Container Count Over Time")
     
-    container_timeline = df.groupby(['datetime', 'host_id'])['active_containers'].sum().reset_index()
-    
-    fig3 = px.area(
-        container_timeline,
-        x='datetime',
-        y='active_containers',
-        color='host_id',
-        title='Container Count Timeline',
-        labels={'active_containers': 'Containers', 'datetime': 'Time'},
-        template='plotly_white'
-    )
-    fig3.update_layout(height=400)
+    fig3 = cached_figure('container_timeline', df, lambda: build_container_timeline_figure(df))
     st.plotly_chart(fig3, use_container_width=True)
 
 
-def render_utilization_trends(df: pd.DataFrame):
-    """Render resource utilization trends."""
-    st.markdown("## 📈 Resource Utilization Trends")
-    
-    if df.empty:
-        st.warning("No data available")
-        return
-    
+def build_utilization_figure(df: pd.DataFrame) -> go.Figure:
+    """Build the per-host CPU and memory utilization subplots."""
     # Create subplots
     fig = make_subplots(
         rows=2, cols=1,
@@ -754,34 +1143,34 @@ def render_utilization_trends(df: pd.DataFrame):
         vertical_spacing=0.15
     )
     
-    # CPU utilization
-    for host_id in df['host_id'].unique():
-        host_data = df[df['host_id'] == host_id]
-        fig.add_trace(
-            go.Scatter(
-                x=host_data['datetime'],
-                y=host_data['cpu_utilization'] * 100,
-                mode='lines',
-                name=f'{host_id} CPU',
-                legendgroup=host_id
-            ),
-            row=1, col=1
-        )
+    # Split the log by host once and collect both of each host's traces,
+    # then add them in one call (each add_trace re-validates the figure)
+    traces, rows = [], []
+    for host_id, host_data in df.groupby('host_id', sort=False, observed=True):
+        # CPU utilization
+        cpu_data = downsample_series(host_data, 'cpu_utilization')
+        traces.append(go.Scattergl(
+            x=cpu_data['datetime'].to_numpy(),
+            y=cpu_data['cpu_utilization'].to_numpy() * 100,
+            mode='lines',
+            name=f'{host_id} CPU',
+            legendgroup=host_id
+        ))
+        rows.append(1)
+        
+        # Memory utilization
+        mem_data = downsample_series(host_data, 'memory_utilization')
+        traces.append(go.Scattergl(
+            x=mem_data['datetime'].to_numpy(),
+            y=mem_data['memory_utilization'].to_numpy() * 100,
+            mode='lines',
+            name=f'{host_id} Mem',
+            legendgroup=host_id,
+            showlegend=False
+        ))
+        rows.append(2)
     
-    # Memory utilization
-    for host_id in df['host_id'].unique():
-        host_data = df[df['host_id'] == host_id]
-        fig.add_trace(
-            go.Scatter(
-                x=host_data['datetime'],
-                y=host_data['memory_utilization'] * 100,
-                mode='lines',
-                name=f'{host_id} Mem',
-                legendgroup=host_id,
-                showlegend=False
-            ),
-            row=2, col=1
-        )
+    fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
     
     fig.update_xaxes(title_text="Time", row=2, col=1)
     fig.update_yaxes(title_text="CPU %", row=1, col=1)
@@ -792,82 +1181,130 @@ def render_utilization_trends(df: pd.DataFrame):
         template='plotly_white',
         hovermode='x unified'
     )
+    return fig
+
+
+def render_utilization_trends(df: pd.DataFrame):
+    """Render resource utilization trends."""
+    st.markdown("## 📈 Resource Utilization Trends")
+    
+    if df.empty:
+        st.warning("No data available")
+        return
     
+    fig = cached_figure('utilization', df, lambda: build_utilization_figure(df))
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_kpi_summary(kpis: dict, df: pd.DataFrame):
+# KPI card values and the KPI-file keys that override them, in priority order
+KPI_FILE_KEYS = {
+    'total_energy_wh': ('total_energy_wh',),
+    'avg_power': ('average_power_watts', 'total_power_watts'),
+    'total_containers': ('total_containers',),
+    'total_hosts': ('total_hosts',),
+    'active_hosts': ('active_hosts',),
+    'avg_cpu_pct': ('average_cpu_utilization',),  # JSON already has percentages
+    'avg_mem_pct': ('average_memory_utilization',),
+    'metrics_collected': ('total_data_points', 'metrics_collected'),
+}
+
+
+def resolve_kpi_file_values(kpis: dict, values: dict) -> dict:
+    """Overlay the KPI file's values onto values, using the first key present for each."""
+    resolved = dict(values)
+    if kpis:
+        for name, keys in KPI_FILE_KEYS.items():
+            for key in keys:
+                if key in kpis:
+                    resolved[name] = kpis[key]
+                    break
+    return resolved
+
+
+def with_ratios(values: dict) -> dict:
+    """Add the power-per-container and containers-per-host ratios to values."""
+    total_containers = values['total_containers']
+    total_hosts = values['total_hosts']
+    values['power_per_container'] = (values['avg_power'] / total_containers) if total_containers > 0 else 0.0
+    values['containers_per_host'] = (total_containers / total_hosts) if total_hosts > 0 else 0.0
+    return values
+
+
+def compute_kpi_values(kpis: dict, df: pd.DataFrame, latest: pd.DataFrame = None) -> dict:
+    """Work out the KPI card values (formatted for display) from the data and KPI file."""
+    if kpis and all(any(key in kpis for key in keys) for keys in KPI_FILE_KEYS.values()):
+        # The KPI file covers every card: nothing needs computing from the log
+        values = with_ratios(resolve_kpi_file_values(kpis, {}))
+    elif not df.empty:
+        # Calculate KPIs from current data
+        if latest is None:
+            latest = latest_per_host(df)
+        
+        avg_power = float(latest['power_watts'].mean())
+        
+        # Total energy is approximated as average power over 1 hour of operation (Wh);
+        # ratios are derived from the current data before KPI-file overrides
+        computed = with_ratios({
+            'total_energy_wh': avg_power * 1.0,
+            'avg_power': avg_power,
+            'total_containers': int(latest['active_containers'].sum()),
+            'total_hosts': int(len(latest)),
+            'active_hosts': int((latest['state'] == 'active').sum()),
+            # Already in decimal form, convert to percentage
+            'avg_cpu_pct': float(latest['cpu_utilization'].mean() * 100),
+            'avg_mem_pct': float(latest['memory_utilization'].mean() * 100),
+            'metrics_collected': len(df),
+        })
+        values = resolve_kpi_file_values(kpis, computed)
+    else:
+        # No data available, use KPI file or defaults
+        values = with_ratios(resolve_kpi_file_values(kpis, dict.fromkeys(KPI_FILE_KEYS, 0)))
+    
+    return {
+        'total_energy': f"{values['total_energy_wh']:.2f} Wh",
+        'avg_power': f"{values['avg_power']:.2f} W",
+        'power_per_container': f"{values['power_per_container']:.2f} W",
+        'total_hosts': values['total_hosts'],
+        'active_hosts': f"{values['active_hosts']:.1f}",
+        'total_containers': values['total_containers'],
+        'containers_per_host': f"{values['containers_per_host']:.2f}",
+        'avg_cpu': f"{float(values['avg_cpu_pct']):.1f}%",
+        'avg_mem': f"{float(values['avg_mem_pct']):.1f}%",
+        'metrics_collected': values['metrics_collected'],
+    }
+
+
+def kpi_values(kpis: dict, df: pd.DataFrame, latest: pd.DataFrame = None) -> dict:
+    """Return compute_kpi_values(), reusing the last result while data and KPIs are unchanged."""
+    key = (data_version(df), json.dumps(kpis, sort_keys=True, default=str))
+    cached = st.session_state.get('kpi_values')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    values = compute_kpi_values(kpis, df, latest)
+    st.session_state['kpi_values'] = (key, values)
+    return values
+
+
+def render_kpi_summary(kpis: dict, df: pd.DataFrame, latest: pd.DataFrame = None):
     """Render KPI summary cards."""
     st.markdown("## 🎯 Performance KPIs")
     
-    # Calculate KPIs from current data if KPI file is missing or incomplete
-    if not kpis or not df.empty:
-        # Get latest data for each host
-        if not df.empty:
-            latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()].reset_index(drop=True)
-            
-            # Calculate KPIs from current data
-            total_power = float(latest['power_watts'].sum())
-            avg_power = float(latest['power_watts'].mean())
-            total_containers = int(latest['active_containers'].sum())
-            active_hosts = int((latest['state'] == 'active').sum())
-            total_hosts = int(len(latest))
-            
-            # Calculate average CPU/Memory (already in decimal form, convert to percentage)
-            avg_cpu_pct = float(latest['cpu_utilization'].mean() * 100)
-            avg_mem_pct = float(latest['memory_utilization'].mean() * 100)
-            
-            # Calculate derived metrics
-            power_per_container = (avg_power / total_containers) if total_containers > 0 else 0.0
-            containers_per_host = (total_containers / total_hosts) if total_hosts > 0 else 0.0
-            
-            # Calculate total energy (approximate: average power * time in hours)
-            # For real-time monitoring, estimate based on average power
-            # Assuming 1 hour of operation for estimation
-            total_energy_wh = avg_power * 1.0  # Watts * hours = Wh
-            
-            # Use calculated values or fall back to KPI file values
-            total_energy_wh = kpis.get('total_energy_wh', total_energy_wh) if kpis else total_energy_wh
-            avg_power = kpis.get('average_power_watts', kpis.get('total_power_watts', avg_power)) if kpis else avg_power
-            total_containers = kpis.get('total_containers', total_containers) if kpis else total_containers
-            total_hosts = kpis.get('total_hosts', total_hosts) if kpis else total_hosts
-            active_hosts = kpis.get('active_hosts', active_hosts) if kpis else active_hosts
-            
-            # CPU/Memory: Check if already in percentage (from JSON) or needs conversion
-            if kpis and 'average_cpu_utilization' in kpis:
-                # JSON already has percentage, use as-is
-                avg_cpu_pct = float(kpis['average_cpu_utilization'])
-            if kpis and 'average_memory_utilization' in kpis:
-                # JSON already has percentage, use as-is
-                avg_mem_pct = float(kpis['average_memory_utilization'])
-            
-            metrics_collected = kpis.get('total_data_points', kpis.get('metrics_collected', len(df))) if kpis else len(df)
-        else:
-            # No data available, use KPI file or defaults
-            total_energy_wh = kpis.get('total_energy_wh', 0) if kpis else 0
-            avg_power = kpis.get('average_power_watts', kpis.get('total_power_watts', 0)) if kpis else 0
-            total_containers = kpis.get('total_containers', 0) if kpis else 0
-            total_hosts = kpis.get('total_hosts', 0) if kpis else 0
-            active_hosts = kpis.get('active_hosts', 0) if kpis else 0
-            avg_cpu_pct = kpis.get('average_cpu_utilization', 0) if kpis else 0
-            avg_mem_pct = kpis.get('average_memory_utilization', 0) if kpis else 0
-            power_per_container = (avg_power / total_containers) if total_containers > 0 else 0.0
-            containers_per_host = (total_containers / total_hosts) if total_hosts > 0 else 0.0
-            metrics_collected = kpis.get('total_data_points', kpis.get('metrics_collected', 0)) if kpis else 0
+    values = kpi_values(kpis, df, latest)
     
     # Main KPIs
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown("### ⚡ Energy Metrics")
-        st.metric("Total Energy", f"{total_energy_wh:.2f} Wh")
-        st.metric("Average Power", f"{avg_power:.2f} W")
-        st.metric("Power per Container", f"{power_per_container:.2f} W")
+        st.metric("Total Energy", values['total_energy'])
+        st.metric("Average Power", values['avg_power'])
+        st.metric("Power per Container", values['power_per_container'])
     
     with col2:
         st.markdown("### 🖥️ Host Metrics")
-        st.metric("Total Hosts", total_hosts)
-        st.metric("Avg Active Hosts", f"{active_hosts:.1f}")
+        st.metric("Total Hosts", values['total_hosts'])
+        st.metric("Avg Active Hosts", values['active_hosts'])
         
         if kpis and 'consolidation_statistics' in kpis:
             energy_saved = kpis['consolidation_statistics'].get('total_energy_saved_watts', 0)
@@ -875,8 +1312,8 @@ def render_kpi_summary(kpis: dict, df: pd.DataFrame):
     
     with col3:
         st.markdown("### 📦 Workload Stats")
-        st.metric("Total Containers", total_containers)
-        st.metric("Containers/Host", f"{containers_per_host:.2f}")
+        st.metric("Total Containers", values['total_containers'])
+        st.metric("Containers/Host", values['containers_per_host'])
         
         if kpis and 'migration_statistics' in kpis:
             migrations = kpis['migration_statistics'].get('total_migrations', 0)
@@ -884,9 +1321,9 @@ def render_kpi_summary(kpis: dict, df: pd.DataFrame):
     
     with col4:
         st.markdown("### 📊 Utilization")
-        st.metric("Avg CPU Usage", f"{avg_cpu_pct:.1f}%")
-        st.metric("Avg Memory Usage", f"{avg_mem_pct:.1f}%")
-        st.metric("Metrics Collected", metrics_collected)
+        st.metric("Avg CPU Usage", values['avg_cpu'])
+        st.metric("Avg Memory Usage", values['avg_mem'])
+        st.metric("Metrics Collected", values['metrics_collected'])
     
     # Detailed consolidation stats
     if 'consolidation_statistics' in kpis:
@@ -936,76 +1373,94 @@ def render_migration_events(df: pd.DataFrame):
     
     # Sample migration table
     if not df.empty:
-        # Detect state changes as proxy for migrations
-        state_changes = []
-        
-        for host_id in df['host_id'].unique():
-            host_data = df[df['host_id'] == host_id].sort_values('datetime')
-            state_diff = host_data['active_containers'].diff()
-            
-            for idx, row in host_data[state_diff != 0].iterrows():
-                # Format timestamp to Sri Lanka timezone string
-                timestamp_str = format_sri_lanka_time(row['datetime'], '%Y-%m-%d %H:%M:%S')
-                state_changes.append({
-                    'Timestamp (SLT)': timestamp_str,
-                    'Host': row['host_id'],
-                    'Event': 'Container Added' if state_diff[idx] > 0 else 'Container Removed',
-                    'Container Count': row['active_containers']
-                })
-        
-        if state_changes:
-            st.dataframe(
-                pd.DataFrame(state_changes).sort_values('Timestamp (SLT)', ascending=False).head(20),
-                use_container_width=True
-            )
+        # Detect state changes as proxy for migrations, in one vectorized pass:
+        # sort once, diff container counts within each host, keep the changes
+        ordered = df.sort_values(['host_id', 'datetime'], kind='stable')
+        diff = ordered.groupby('host_id', sort=False, observed=True)['active_containers'].diff()
+        changed = diff.ne(0) & diff.notna()
+        changes = ordered.loc[changed, ['datetime', 'host_id', 'active_containers']].nlargest(20, 'datetime')
+        
+        if not changes.empty:
+            # Format timestamps to Sri Lanka timezone strings for just these rows
+            times = changes['datetime']
+            if times.dt.tz is None:
+                times = times.dt.tz_localize('UTC')
+            state_changes = pd.DataFrame({
+                'Timestamp (SLT)': times.dt.tz_convert(SRI_LANKA_TZ).dt.strftime('%Y-%m-%d %H:%M:%S'),
+                'Host': changes['host_id'],
+                'Event': np.where(diff[changes.index] > 0, 'Container Added', 'Container Removed'),
+                'Container Count': changes['active_containers']
+            })
+            st.dataframe(state_changes, use_container_width=True)
         else:
             st.write("No migration events detected yet")
 
 
+def excel_engine() -> str:
+    """Pick the Excel writer engine: xlsxwriter is much faster, openpyxl is the fallback."""
+    import importlib.util
+    return 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+
+def prepare_export_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy the log for export with datetimes as plain strings (Excel has no tz support)."""
+    export_df = df.copy()
+    if 'datetime' in export_df.columns:
+        export_df['datetime'] = pd.to_datetime(export_df['datetime']).dt.strftime('%Y-%m-%d %H:%M:%S')
+    return export_df
+
+
+def build_summary_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Build the Metric/Value summary sheet from the latest row of each host."""
+    latest = latest_per_host(df) if 'host_id' in df.columns else df.iloc[-1:]
+    
+    # One aggregation pass over the latest rows instead of a reduction per metric
+    spec = {
+        'power_watts': 'sum',
+        'cpu_utilization': 'mean',
+        'memory_utilization': 'mean',
+        'active_containers': 'sum',
+    }
+    spec.update({column: 'mean' for column in ('latency_ms', 'throughput_mbps') if column in latest.columns})
+    agg = latest.agg(spec)
+    
+    def optional(key):
+        value = agg.get(key, np.nan)
+        return 'N/A' if pd.isna(value) else f"{value:.2f}"
+    
+    return pd.DataFrame({
+        'Metric': [
+            'Total Power (W)',
+            'Avg CPU Utilization (%)',
+            'Avg Memory Utilization (%)',
+            'Avg Latency (ms)',
+            'Avg Throughput (Mbps)',
+            'Total Containers',
+            'Active Hosts'
+        ],
+        'Value': [
+            f"{agg['power_watts']:.2f}",
+            f"{agg['cpu_utilization'] * 100:.2f}",
+            f"{agg['memory_utilization'] * 100:.2f}",
+            optional('latency_ms'),
+            optional('throughput_mbps'),
+            f"{agg['active_containers']:.0f}",
+            f"{(latest['state'] == 'active').sum():.0f}"
+        ]
+    })
+
+
 def export_to_excel_with_graphs(df: pd.DataFrame, output_path: str = "output/energy_metrics_report.xlsx"):
-    """Export data to Excel with graphs using openpyxl and matplotlib."""
+    """Export the data and summary sheets to Excel."""
     try:
-        from openpyxl import Workbook
-        from openpyxl.utils.dataframe import dataframe_to_rows
-        from openpyxl.drawing.image import Image
-        import matplotlib.pyplot as plt
-        import io
-        
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Energy Metrics Data"
-        
-        # Write data to Excel
-        if not df.empty:
-            # Prepare data for export
-            export_df = df.copy()
-            if 'datetime' in export_df.columns:
-                export_df['datetime'] = pd.to_datetime(export_df['datetime']).dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Write headers
-            for r in dataframe_to_rows(export_df, index=False, header=True):
-                ws.append(r)
-        
-        # Create summary sheet
-        ws_summary = wb.create_sheet("Summary")
-        ws_summary.append(["Metric", "Value"])
-        if not df.empty:
-            latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()] if 'host_id' in df.columns else df.iloc[-1:]
-            ws_summary.append(["Total Power (W)", f"{latest['power_watts'].sum():.2f}"])
-            ws_summary.append(["Avg CPU Utilization (%)", f"{latest['cpu_utilization'].mean() * 100:.2f}"])
-            ws_summary.append(["Avg Memory Utilization (%)", f"{latest['memory_utilization'].mean() * 100:.2f}"])
-            if 'latency_ms' in df.columns:
-                ws_summary.append(["Avg Latency (ms)", f"{latest['latency_ms'].mean():.2f}"])
-            if 'throughput_mbps' in df.columns:
-                ws_summary.append(["Avg Throughput (Mbps)", f"{latest['throughput_mbps'].mean():.2f}"])
-            ws_summary.append(["Total Containers", f"{latest['active_containers'].sum():.0f}"])
-            ws_summary.append(["Active Hosts", f"{(latest['state'] == 'active').sum():.0f}"])
-        
-        # Save workbook
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        wb.save(output_path)
+        
+        # Write whole frames at once rather than appending row by row
+        with pd.ExcelWriter(output_path, engine=excel_engine()) as writer:
+            prepare_export_frame(df).to_excel(writer, sheet_name='Energy Metrics Data', index=False)
+            summary_df = build_summary_frame(df) if not df.empty else pd.DataFrame(columns=['Metric', 'Value'])
+            summary_df.to_excel(writer, sheet_name='Summary', index=False)
         
         return output_path
     except Exception as e:
@@ -1020,41 +1475,14 @@ def export_to_excel_simple(df: pd.DataFrame):
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Prepare data for export
-        export_df = df.copy()
-        if 'datetime' in export_df.columns:
-            export_df['datetime'] = pd.to_datetime(export_df['datetime']).dt.strftime('%Y-%m-%d %H:%M:%S')
-        
         # Create Excel writer
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output_path, engine=excel_engine()) as writer:
             # Write main data
-            export_df.to_excel(writer, sheet_name='Energy Metrics Data', index=False)
+            prepare_export_frame(df).to_excel(writer, sheet_name='Energy Metrics Data', index=False)
             
             # Create summary sheet
             if not df.empty:
-                latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()] if 'host_id' in df.columns else df.iloc[-1:]
-                summary_data = {
-                    'Metric': [
-                        'Total Power (W)',
-                        'Avg CPU Utilization (%)',
-                        'Avg Memory Utilization (%)',
-                        'Avg Latency (ms)',
-                        'Avg Throughput (Mbps)',
-                        'Total Containers',
-                        'Active Hosts'
-                    ],
-                    'Value': [
-                        f"{latest['power_watts'].sum():.2f}",
-                        f"{latest['cpu_utilization'].mean() * 100:.2f}",
-                        f"{latest['memory_utilization'].mean() * 100:.2f}",
-                        f"{latest['latency_ms'].mean():.2f}" if 'latency_ms' in df.columns else 'N/A',
-                        f"{latest['throughput_mbps'].mean():.2f}" if 'throughput_mbps' in df.columns else 'N/A',
-                        f"{latest['active_containers'].sum():.0f}",
-                        f"{(latest['state'] == 'active').sum():.0f}"
-                    ]
-                }
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                build_summary_frame(df).to_excel(writer, sheet_name='Summary', index=False)
         
         return output_path
     except Exception as e:
@@ -1064,8 +1492,92 @@ def export_to_excel_simple(df: pd.DataFrame):
         return None
 
 
-def render_performance_metrics(df: pd.DataFrame):
-    """Render latency and throughput performance metrics."""
+def build_host_trend_figure(df: pd.DataFrame, y: str, title: str, label: str) -> go.Figure:
+    """Build a per-host line chart of one metric over time (one WebGL trace per host)."""
+    # Group once and hand each host's NumPy arrays straight to its trace
+    traces = []
+    for host_id, host_data in df.groupby('host_id', sort=False, observed=True):
+        host_data = downsample_series(host_data, y)
+        traces.append(go.Scattergl(
+            x=host_data['datetime'].to_numpy(),
+            y=host_data[y].to_numpy(),
+            mode='lines',
+            name=host_id,
+            line=dict(width=2)
+        ))
+    
+    # Build the figure from the whole trace list in one validation pass
+    fig = go.Figure(data=traces)
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='Time',
+        yaxis_title=label,
+        legend_title_text='host_id',
+        template='plotly_white',
+        height=400
+    )
+    return fig
+
+
+def histogram_bar(values: pd.Series, name: str, color: str) -> go.Bar:
+    """Bin values with NumPy and return the counts as a bar trace.
+    
+    Only the bin counts are sent to the browser instead of every sample for
+    Plotly.js to bin client-side.
+    """
+    samples = values.to_numpy(dtype=float)
+    samples = samples[~np.isnan(samples)]
+    if samples.size == 0:
+        return go.Bar(x=[], y=[], name=name, marker_color=color)
+    
+    counts, edges = np.histogram(samples, bins='auto')
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name=name,
+        marker_color=color
+    )
+
+
+def build_performance_distribution_figure(latest: pd.DataFrame) -> go.Figure:
+    """Build the latency and throughput distribution histograms."""
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Latency Distribution', 'Throughput Distribution'),
+        vertical_spacing=0.15
+    )
+    
+    # Latency and throughput distributions, binned server-side
+    fig.add_traces(
+        [
+            histogram_bar(latest['latency_ms'], 'Latency', '#e74c3c'),
+            histogram_bar(latest['throughput_mbps'], 'Throughput', '#2ecc71'),
+        ],
+        rows=[1, 2],
+        cols=[1, 1]
+    )
+    
+    fig.update_xaxes(title_text="Latency (ms)", row=1, col=1)
+    fig.update_xaxes(title_text="Throughput (Mbps)", row=2, col=1)
+    fig.update_yaxes(title_text="Frequency", row=1, col=1)
+    fig.update_yaxes(title_text="Frequency", row=2, col=1)
+    
+    fig.update_layout(
+        height=600,
+        template='plotly_white',
+        showlegend=False
+    )
+    return fig
+
+
+def render_performance_metrics(df: pd.DataFrame, latest: pd.DataFrame = None, df_view: pd.DataFrame = None):
+    """Render latency and throughput performance metrics.
+    
+    The metrics and their deltas use all of df; the trend charts only show
+    df_view, the selected display window (defaults to df).
+    """
     st.markdown("## ⚡ Performance Metrics")
     
     if df.empty:
@@ -1078,7 +1590,10 @@ def render_performance_metrics(df: pd.DataFrame):
         return
     
     # Latest metrics
-    latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()].reset_index(drop=True)
+    if latest is None:
+        latest = latest_per_host(df)
+    if df_view is None:
+        df_view = df
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -1117,74 +1632,20 @@ def render_performance_metrics(df: pd.DataFrame):
     
     with col1:
         st.markdown("### ⏱️ Latency Over Time")
-        if not df.empty and 'latency_ms' in df.columns:
-            fig = px.line(
-                df,
-                x='datetime',
-                y='latency_ms',
-                color='host_id',
-                title='Latency Trend by Host',
-                labels={'latency_ms': 'Latency (ms)', 'datetime': 'Time'},
-                template='plotly_white'
-            )
-            fig.update_layout(height=400)
+        if not df_view.empty:
+            fig = cached_figure('latency_trend', df_view, lambda: build_host_trend_figure(df_view, 'latency_ms', 'Latency Trend by Host', 'Latency (ms)'))
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("### 📡 Throughput Over Time")
-        if not df.empty and 'throughput_mbps' in df.columns:
-            fig = px.line(
-                df,
-                x='datetime',
-                y='throughput_mbps',
-                color='host_id',
-                title='Throughput Trend by Host',
-                labels={'throughput_mbps': 'Throughput (Mbps)', 'datetime': 'Time'},
-                template='plotly_white'
-            )
-            fig.update_layout(height=400)
+        if not df_view.empty:
+            fig = cached_figure('throughput_trend', df_view, lambda: build_host_trend_figure(df_view, 'throughput_mbps', 'Throughput Trend by Host', 'Throughput (Mbps)'))
             st.plotly_chart(fig, use_container_width=True)
     
     # Combined performance metrics
     st.markdown("### 📊 Performance Overview")
     if not df.empty and 'latency_ms' in df.columns and 'throughput_mbps' in df.columns:
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=('Latency Distribution', 'Throughput Distribution'),
-            vertical_spacing=0.15
-        )
-        
-        # Latency distribution
-        fig.add_trace(
-            go.Histogram(
-                x=latest['latency_ms'],
-                name='Latency',
-                marker_color='#e74c3c'
-            ),
-            row=1, col=1
-        )
-        
-        # Throughput distribution
-        fig.add_trace(
-            go.Histogram(
-                x=latest['throughput_mbps'],
-                name='Throughput',
-                marker_color='#2ecc71'
-            ),
-            row=2, col=1
-        )
-        
-        fig.update_xaxes(title_text="Latency (ms)", row=1, col=1)
-        fig.update_xaxes(title_text="Throughput (Mbps)", row=2, col=1)
-        fig.update_yaxes(title_text="Frequency", row=1, col=1)
-        fig.update_yaxes(title_text="Frequency", row=2, col=1)
-        
-        fig.update_layout(
-            height=600,
-            template='plotly_white',
-            showlegend=False
-        )
-        
+        fig = cached_figure('performance_distribution', df, lambda: build_performance_distribution_figure(latest))
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -1200,89 +1661,47 @@ def render_footer():
     """, unsafe_allow_html=True)
 
 
-def main():
-    """Main dashboard application."""
-    # Initialize session state
-    if 'export_excel' not in st.session_state:
-        st.session_state['export_excel'] = False
-    
-    # Initialize data loader
-    data_loader = DashboardDataLoader()
-    
-    # Render header
-    render_header()
-    
-    # Render sidebar and get settings
-    auto_refresh, refresh_interval = render_sidebar(data_loader)
-    
-    # Load data - always check for file changes
-    # Get current file modification time to force reload if changed
-    force_reload = False
-    if data_loader.csv_path.exists():
-        current_file_mtime = os.path.getmtime(data_loader.csv_path)
-        last_known_mtime = st.session_state.get('file_check_mtime', 0)
-        
-        # If file modification time changed, force reload
-        if current_file_mtime != last_known_mtime:
-            force_reload = True
-            st.session_state['file_check_mtime'] = current_file_mtime
-    
-    # Also check if user manually requested refresh
-    if st.session_state.get('force_reload', False):
-        force_reload = True
-        st.session_state['force_reload'] = False
-    
-    df = data_loader.load_csv_data(force_reload=force_reload)
+def build_power_timeline_figure(df: pd.DataFrame) -> go.Figure:
+    """Build the compact power timeline shown on the overview tab."""
+    power_by_time = downsample_series(total_by_time(df), 'power_watts')
+    fig = go.Figure(go.Scattergl(
+        x=power_by_time['datetime'].to_numpy(),
+        y=power_by_time['power_watts'].to_numpy(),
+        mode='lines',
+        line=dict(width=2)
+    ))
+    fig.update_layout(
+        title='Power Consumption Timeline',
+        xaxis_title='datetime',
+        yaxis_title='power_watts',
+        template='plotly_white',
+        height=300
+    )
+    return fig
+
+
+def build_host_status_figure(latest: pd.DataFrame) -> go.Figure:
+    """Build the host status pie chart shown on the overview tab."""
+    status_counts = latest['state'].value_counts()
+    
+    # A handful of slices: build the trace directly instead of going through px
+    color_map = {'active': '#2ecc71', 'shutdown': '#f39c12', 'idle': '#f39c12'}  # Green for active, Orange/Yellow for shutdown/idle
+    fig = go.Figure(go.Pie(
+        values=status_counts.to_numpy(),
+        labels=status_counts.index.to_numpy(),
+        marker=dict(colors=[color_map.get(state, '#636efa') for state in status_counts.index])
+    ))
+    fig.update_layout(title='Host Status Distribution', template='plotly_white', height=300)
+    return fig
+
+
+def render_live_tabs(data_loader: DashboardDataLoader):
+    """Render the dashboard tabs from freshly loaded data (run as a fragment)."""
+    # Only rows appended since the last run are parsed; status messages are
+    # shown by the sidebar's render_data_status fragment
+    df = data_loader.load_csv_data(show_status=False)
     kpis = data_loader.load_kpis()
     
-    # Debug: Show what data we're actually loading
-    if not df.empty:
-        st.sidebar.markdown("### 🔍 Debug Info")
-        st.sidebar.write(f"**Data Points:** {len(df)}")
-        latest_dt_debug = df['datetime'].iloc[-1]
-        latest_time_debug_str = format_sri_lanka_time(latest_dt_debug, '%Y-%m-%d %H:%M:%S')
-        st.sidebar.write(f"**Latest Time:** {latest_time_debug_str} (SLT)")
-        st.sidebar.write(f"**Total Power:** {df['power_watts'].sum():.0f}W")
-        st.sidebar.write(f"**Hosts:** {df['host_id'].nunique()}")
-        st.sidebar.write(f"**Containers:** {df['active_containers'].sum()}")
-        st.sidebar.markdown("---")
-    
-    # Start main content with sticky header spacing
-    st.markdown('<div class="main-content">', unsafe_allow_html=True)
-    
-    # Add JavaScript real-time clock (Sri Lanka timezone - UTC+5:30)
-    st.markdown("""
-    <script>
-        function updateClock() {
-            const now = new Date();
-            // Sri Lanka timezone is UTC+5:30
-            const sriLankaOffset = 5.5 * 60 * 60 * 1000; // 5.5 hours in milliseconds
-            const utcTime = now.getTime() + (now.getTimezoneOffset() * 60 * 1000);
-            const sriLankaTime = new Date(utcTime + sriLankaOffset);
-            
-            const timeString = sriLankaTime.toLocaleString('en-US', {
-                year: 'numeric',
-                month: '2-digit',
-                day: '2-digit',
-                hour: '2-digit',
-                minute: '2-digit',
-                second: '2-digit',
-                hour12: false
-            }) + ' (SLT)';
-            
-            // Update all clock elements
-            const clockElements = document.querySelectorAll('.live-clock');
-            clockElements.forEach(element => {
-                element.textContent = timeString;
-            });
-        }
-        
-        // Update clock every second
-        setInterval(updateClock, 1000);
-        updateClock(); // Initial call
-    </script>
-    """, unsafe_allow_html=True)
-    
     # Create tabs
     tabs = st.tabs([
         "📊 Overview",
@@ -1293,66 +1712,105 @@ def main():
         "⚡ Performance",
         "🔄 Migrations",
         "🎯 KPIs"
-    ])
+    ], key='live_tab', on_change='rerun')
+    
+    # Latest row per host, computed once and shared by every tab
+    latest = latest_per_host(df) if not df.empty else None
+    
+    # Time-series charts only get the selected window of history
+    df_view = window_view(df, DISPLAY_WINDOWS.get(st.session_state.get('display_window')))
     
+    # Only the selected tab is rendered (tab.open): switching tabs reruns this
+    # fragment, so each refresh tick builds one tab instead of all eight
     with tabs[0]:
-        render_metrics_overview(df, kpis)
-        st.markdown("---")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            # Quick energy chart
-            if not df.empty:
-                power_by_time = df.groupby('datetime')['power_watts'].sum().reset_index()
-                fig = px.line(
-                    power_by_time,
-                    x='datetime',
-                    y='power_watts',
-                    title='Power Consumption Timeline',
-                    template='plotly_white'
-                )
-                fig.update_layout(height=300)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Quick host status
-            if not df.empty:
-                latest = df.loc[df.groupby('host_id')['timestamp'].idxmax()].reset_index()
-                status_counts = latest['state'].value_counts().reset_index()
-                status_counts.columns = ['State', 'Count']
-                
-                fig = px.pie(
-                    status_counts,
-                    values='Count',
-                    names='State',
-                    title='Host Status Distribution',
-                    color='State',
-                    color_discrete_map={'active': '#2ecc71', 'shutdown': '#f39c12', 'idle': '#f39c12'},  # Green for active, Orange/Yellow for shutdown/idle
-                    template='plotly_white'
-                )
-                fig.update_layout(height=300)
-                st.plotly_chart(fig, use_container_width=True)
+        if tabs[0].open:
+            render_metrics_overview(df, kpis, latest)
+            st.markdown("---")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                # Quick energy chart
+                if not df.empty:
+                    fig = cached_figure('overview_power', df, lambda: build_power_timeline_figure(df))
+                    st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                # Quick host status
+                if not df.empty:
+                    fig = cached_figure('overview_status', df, lambda: build_host_status_figure(latest))
+                    st.plotly_chart(fig, use_container_width=True)
     
     with tabs[1]:
-        render_host_overview(df)
+        if tabs[1].open:
+            render_host_overview(df, latest)
     
     with tabs[2]:
-        render_energy_consumption(df)
+        if tabs[2].open:
+            render_energy_consumption(df_view)
     
     with tabs[3]:
-        render_container_distribution(df)
+        if tabs[3].open:
+            render_container_distribution(df, latest)
     
     with tabs[4]:
-        render_utilization_trends(df)
+        if tabs[4].open:
+            render_utilization_trends(df_view)
     
     with tabs[5]:
-        render_performance_metrics(df)
+        if tabs[5].open:
+            render_performance_metrics(df, latest, df_view)
     
     with tabs[6]:
-        render_migration_events(df)
+        if tabs[6].open:
+            render_migration_events(df)
     
     with tabs[7]:
-        render_kpi_summary(kpis, df)
+        if tabs[7].open:
+            render_kpi_summary(kpis, df, latest)
+
+
+def main():
+    """Main dashboard application."""
+    # Initialize session state
+    if 'export_excel' not in st.session_state:
+        st.session_state['export_excel'] = False
+    
+    # Get the shared data loader
+    data_loader = get_data_loader()
+    
+    # Render header
+    render_header()
+    
+    # Load data - the loader picks up appended rows itself, so a full
+    # reload is only forced when the user manually requested a refresh
+    force_reload = False
+    if st.session_state.get('force_reload', False):
+        force_reload = True
+        st.session_state['force_reload'] = False
+    
+    df = data_loader.load_csv_data(force_reload=force_reload, show_status=False)
+    
+    # Render sidebar and get settings
+    auto_refresh, refresh_interval, live_status_slot, data_status_slot = render_sidebar()
+    run_every = refresh_interval if auto_refresh else None
+    
+    # Store refresh settings in session state (shown in the overview)
+    st.session_state['auto_refresh'] = auto_refresh
+    st.session_state['refresh_interval'] = refresh_interval
+    
+    # The sidebar's live status parts rerun on the same timer as the tabs
+    with live_status_slot:
+        st.fragment(render_live_status, run_every=run_every)()
+    with data_status_slot:
+        st.fragment(render_data_status, run_every=run_every)(data_loader)
+    
+    # Start main content with sticky header spacing
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    # Tab contents rerun on their own timer (a fragment) instead of the
+    # whole script, so the header, sidebar and footer aren't rebuilt each tick
+    live_tabs = st.fragment(render_live_tabs, run_every=run_every)
+    live_tabs(data_loader)
     
     # Handle Excel export
     if st.session_state.get('export_excel', False):
@@ -1376,93 +1834,6 @@ def main():
     
     # Footer
     render_footer()
-    
-    # Auto-refresh logic - enhanced for frequent automatic updates
-    if auto_refresh:
-        # Store refresh settings in session state for persistence
-        st.session_state['auto_refresh'] = True
-        st.session_state['refresh_interval'] = refresh_interval
-        
-        # Use JavaScript meta-refresh combined with Streamlit rerun for seamless updates
-        # This ensures the page updates automatically without user interaction
-        st.markdown(f"""
-        <script>
-            // Auto-refresh mechanism - updates every {refresh_interval} seconds
-            let refreshInterval = {refresh_interval * 1000};
-            let countdown = {refresh_interval};
-            let refreshCount = 0;
-            
-            // Create or update countdown display
-            function updateCountdown() {{
-                // Find or create countdown element
-                let countdownEl = document.getElementById('refresh-countdown');
-                if (!countdownEl) {{
-                    countdownEl = document.createElement('div');
-                    countdownEl.id = 'refresh-countdown';
-                    countdownEl.style.cssText = 'position: fixed; bottom: 20px; right: 20px; background: rgba(46, 204, 113, 0.9); color: white; padding: 10px 15px; border-radius: 5px; font-family: monospace; font-weight: bold; z-index: 9999; box-shadow: 0 2px 10px rgba(0,0,0,0.3);';
-                    document.body.appendChild(countdownEl);
-                }}
-                countdownEl.innerHTML = `🔄 Next update in: ${{countdown}}s`;
-            }}
-            
-            // Start countdown timer
-            function startCountdown() {{
-                countdown = {refresh_interval};
-                updateCountdown();
-                
-                let countdownInterval = setInterval(function() {{
-                    countdown--;
-                    updateCountdown();
-                    
-                    if (countdown <= 0) {{
-                        clearInterval(countdownInterval);
-                        refreshCount++;
-                        
-                        // Use Streamlit's rerun API if available, otherwise reload page
-                        if (window.parent !== undefined && window.parent.postMessage) {{
-                            window.parent.postMessage({{
-                                type: 'streamlit:rerun',
-                                always: true
-                            }}, '*');
-                        }} else if (window.streamlit !== undefined && window.streamlit.rerun) {{
-                            window.streamlit.rerun();
-                        }} else {{
-                            // Fallback to page reload
-                            window.location.reload(true);
-                        }}
-                    }}
-                }}, 1000);
-            }}
-            
-            // Start the countdown immediately
-            startCountdown();
-            
-            // Show refresh indicator in console (for debugging)
-            console.log(`🔄 Auto-refresh enabled: every ${{refreshInterval/1000}}s`);
-        </script>
-        
-        <!-- Meta refresh as backup (works even if JavaScript fails) -->
-        <meta http-equiv="refresh" content="{refresh_interval};url=javascript:location.reload(true)">
-        """, unsafe_allow_html=True)
-        
-        # Also use Streamlit's built-in mechanism
-        # Check if file changed and trigger immediate rerun if needed
-        if data_loader.csv_path.exists():
-            current_mtime = os.path.getmtime(data_loader.csv_path)
-            last_check_mtime = st.session_state.get('check_mtime', 0)
-            
-            # If file changed since last check, show notification
-            if current_mtime != last_check_mtime:
-                st.session_state['check_mtime'] = current_mtime
-                # File changed - data will be reloaded on next rerun
-                if current_mtime > last_check_mtime:
-                    # Show visual indicator that data was updated
-                    update_time = datetime.fromtimestamp(current_mtime, tz=timezone.utc)
-                    update_time_str = format_sri_lanka_time(update_time, '%H:%M:%S')
-                    st.sidebar.success(f"🔄 Data updated at {update_time_str} (SLT)")
-    else:
-        # Disable auto-refresh
-        st.session_state['auto_refresh'] = False
 
 
 if __name__ == "__main__":
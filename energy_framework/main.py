@@ -2,34 +2,47 @@
 Main Execution Script - Energy-Efficient Container Consolidation Framework
 
 Integrates all components and runs the complete simulation workflow.
+Run from energy_framework/ (python main.py or python -m main) so the src package resolves.
 """
 
 import os
 import sys
 import time
+import atexit
+import queue
 import logging
-import random
+import logging.handlers
+import numpy as np
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from src.infrastructure.host_monitor import HostMonitor, HostCluster, STATE_ACTIVE, STATE_IDLE
+from src.virtualization.docker_manager import DockerManager
+from src.core.consolidation_engine import ConsolidationEngine
+from src.orchestration.energy_aware_scheduler import EnergyAwareScheduler
+from src.sustainability.energy_metrics_manager import EnergyMetricsManager
+from src.utils.helpers import generate_workload_id
+from src.utils.rng import RNG
 
-from infrastructure.host_monitor import HostMonitor, HostCluster
-from virtualization.docker_manager import DockerManager
-from core.consolidation_engine import ConsolidationEngine
-from orchestration.energy_aware_scheduler import EnergyAwareScheduler
-from sustainability.energy_metrics_manager import EnergyMetricsManager
-from utils.helpers import generate_workload_id
 
+LOG_FILE = 'energy_framework.log'
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('energy_framework.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging: callers only enqueue records, and a background listener
+# thread does the file and stdout writes off the simulation loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler(LOG_FILE),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # drains queued records before exit
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
 
@@ -59,37 +72,36 @@ def create_sample_hosts(num_hosts: int = 5) -> HostCluster:
     cluster = HostCluster()
     
     # Create diverse host configurations
-    host_configs = [
-        {'cpu_cores': 4, 'memory_gb': 8.0, 'p_idle': 50, 'p_max': 200},
-        {'cpu_cores': 8, 'memory_gb': 16.0, 'p_idle': 80, 'p_max': 300},
-        {'cpu_cores': 6, 'memory_gb': 12.0, 'p_idle': 60, 'p_max': 250},
-        {'cpu_cores': 4, 'memory_gb': 8.0, 'p_idle': 45, 'p_max': 180},
-        {'cpu_cores': 8, 'memory_gb': 16.0, 'p_idle': 85, 'p_max': 320},
-    ]
+    host_configs = np.array(
+        [
+            (4, 8.0, 50, 200),
+            (8, 16.0, 80, 300),
+            (6, 12.0, 60, 250),
+            (4, 8.0, 45, 180),
+            (8, 16.0, 85, 320),
+        ],
+        dtype=[('cpu_cores', 'i2'), ('memory_gb', 'f4'), ('p_idle', 'i2'), ('p_max', 'i2')]
+    )
     
-    for i in range(num_hosts):
-        config = host_configs[i % len(host_configs)]
-        
+    # Cycle through the configurations (load is drawn by the monitors every cycle)
+    configs = host_configs[np.arange(num_hosts) % len(host_configs)]
+    
+    for i, config in enumerate(configs):
         host_id = f"host-{i+1:03d}"
+        cpu_cores, memory_gb = int(config['cpu_cores']), float(config['memory_gb'])
         monitor = HostMonitor(
             host_id=host_id,
-            cpu_cores=config['cpu_cores'],
-            memory_gb=config['memory_gb'],
-            is_simulated=True,
-            p_idle=config['p_idle'],
-            p_max=config['p_max']
+            cores=cpu_cores,
+            ram_gb=memory_gb,
+            p_idle=float(config['p_idle']),
+            p_max=float(config['p_max'])
         )
         
-        # Set initial simulated load (varied)
-        initial_cpu = random.uniform(0.1, 0.3)
-        initial_mem = random.uniform(0.2, 0.4)
-        monitor.set_simulated_load(initial_cpu, initial_mem)
-        
         cluster.add_host(monitor)
         
         logger.info(
-            f"  Added {host_id}: {config['cpu_cores']} cores, "
-            f"{config['memory_gb']}GB RAM"
+            f"  Added {host_id}: {cpu_cores} cores, "
+            f"{memory_gb}GB RAM"
         )
     
     return cluster
@@ -115,30 +127,49 @@ def create_sample_workloads() -> list:
         {'prefix': 'cache', 'image': 'redis:latest', 'cpu': (0.5, 1.0), 'mem': (1.0, 2.0), 'sla': 'silver'},
     ]
     
-    workloads = []
+    # Create 15 diverse workloads, cycling through the types
+    num_workloads = 15
+    type_idx = np.arange(num_workloads) % len(workload_types)
     
-    # Create 15 diverse workloads
-    for i in range(15):
-        wtype = workload_types[i % len(workload_types)]
-        
-        cpu_request = round(random.uniform(*wtype['cpu']), 2)
-        mem_request = round(random.uniform(*wtype['mem']), 2)
-        
-        workload = {
-            'name': f"{wtype['prefix']}-{i+1:02d}",
-            'image': wtype['image'],
+    # Request bounds per workload, indexed from per-type lookup tables
+    cpu_bounds = np.array([wtype['cpu'] for wtype in workload_types])[type_idx]
+    mem_bounds = np.array([wtype['mem'] for wtype in workload_types])[type_idx]
+    
+    # Draw all CPU and memory requests at once
+    cpu_requests = np.round(RNG.uniform(cpu_bounds[:, 0], cpu_bounds[:, 1]), 2).tolist()
+    mem_requests = np.round(RNG.uniform(mem_bounds[:, 0], mem_bounds[:, 1]), 2).tolist()
+    
+    workloads = [
+        {
+            'name': f"{workload_types[t]['prefix']}-{i+1:02d}",
+            'image': workload_types[t]['image'],
             'cpu_request': cpu_request,
             'memory_request_gb': mem_request,
-            'sla_tier': wtype['sla']
+            'sla_tier': workload_types[t]['sla']
         }
-        
-        workloads.append(workload)
+        for i, (t, cpu_request, mem_request) in enumerate(zip(type_idx.tolist(), cpu_requests, mem_requests))
+    ]
     
     logger.info(f"Created {len(workloads)} sample workloads")
     
     return workloads
 
 
+def deploy_workload(docker_manager: DockerManager, workload: dict, decision: dict) -> str:
+    """Create and start a container for a workload on the host the scheduler chose."""
+    container_id = generate_workload_id(workload['name'])
+    docker_manager.create_container(
+        container_id,
+        decision['host_id'],
+        image=workload['image'],
+        cpu_request=workload['cpu_request'],
+        memory_request_gb=workload['memory_request_gb'],
+        sla_tier=workload['sla_tier']
+    )
+    docker_manager.start_container(container_id)
+    return container_id
+
+
 def run_simulation(
     num_hosts: int = 5,
     num_cycles: int = 10,
@@ -175,9 +206,7 @@ def run_simulation(
     
     logger.info("\n[3/7] Initializing consolidation engine...")
     consolidation_engine = ConsolidationEngine(
-        host_cluster=host_cluster,
-        docker_manager=docker_manager,
-        consolidation_threshold=0.3,
+        threshold=0.3,
         max_utilization=0.8
     )
     
@@ -196,20 +225,26 @@ def run_simulation(
         output_dir=output_dir,
         host_cluster=host_cluster,
         docker_manager=docker_manager,
-        consolidation_engine=consolidation_engine
+        consolidation_engine=consolidation_engine,
+        history_size=num_cycles
     )
     
     # Deploy initial workloads
     logger.info("\n[6/7] Deploying initial workloads...")
     workloads = create_sample_workloads()
     placement_decisions = scheduler.schedule_batch(workloads)
+    for workload, decision in zip(workloads, placement_decisions):
+        if decision is not None:
+            deploy_workload(docker_manager, workload, decision)
     
-    successful_placements = len([d for d in placement_decisions if d is not None])
+    successful_placements = sum(d is not None for d in placement_decisions)
     logger.info(f"  Successfully placed: {successful_placements}/{len(workloads)} containers")
     
     # Show initial cluster state
     logger.info("\n[7/7] Initial cluster state:")
-    initial_summary = host_cluster.get_cluster_summary()
+    # One collected cycle; the loop's last batch is reused for the final summary
+    batch = host_cluster.get_all_metrics_batched()
+    initial_summary = host_cluster.get_cluster_summary(batch)
     for key, value in initial_summary.items():
         logger.info(f"  {key}: {value}")
     
@@ -218,16 +253,23 @@ def run_simulation(
     logger.info("STARTING SIMULATION CYCLES")
     logger.info("=" * 70)
     
+    # Consolidation results accumulated over the run
+    consolidation_stats = {'runs': 0, 'hosts_shutdown': 0, 'energy_saved_watts': 0.0}
+    
+    # Pace cycles against a monotonic deadline so per-cycle work doesn't add drift
+    cycle_period = 0.5
+    next_deadline = time.monotonic() + cycle_period
+    
     for cycle in range(1, num_cycles + 1):
         logger.info(f"\n--- Cycle {cycle}/{num_cycles} ---")
         
-        # Collect metrics
-        metrics = metrics_manager.collect_metrics()
+        # Collect metrics (a HostMetricsBatch: one array per column)
+        batch = metrics_manager.collect_metrics()
         
         # Log current state
-        total_power = sum(m.power_watts for m in metrics)
-        active_hosts = len([m for m in metrics if m.state == "active"])
-        total_containers = sum(m.active_containers for m in metrics)
+        total_power = float(batch.power_watts.sum(dtype=np.float64))
+        active_hosts = int((batch.state_code == STATE_ACTIVE).sum())
+        total_containers = int(batch.active_containers.sum())
         
         logger.info(
             f"  Power: {total_power:.2f}W | "
@@ -238,13 +280,16 @@ def run_simulation(
         # Run consolidation periodically
         if cycle % consolidation_interval == 0:
             logger.info(f"\n  >>> Running consolidation (cycle {cycle})...")
-            result = consolidation_engine.consolidate_threshold_based()
+            result = consolidation_engine.run_consolidation(batch)
+            consolidation_stats['runs'] += 1
+            consolidation_stats['hosts_shutdown'] += result['hosts_shutdown']
+            consolidation_stats['energy_saved_watts'] += result['energy_saved']
             
-            if result.containers_migrated > 0:
+            if result['hosts_shutdown'] > 0:
                 logger.info(
-                    f"  Consolidation: {result.containers_migrated} migrations, "
-                    f"{result.hosts_consolidated} hosts shutdown, "
-                    f"{result.energy_saved_watts:.2f}W saved"
+                    f"  Consolidation: {result['migrations']} migrations, "
+                    f"{result['hosts_shutdown']} hosts shutdown, "
+                    f"{result['energy_saved']:.2f}W saved"
                 )
             else:
                 logger.info("  No consolidation needed")
@@ -255,86 +300,89 @@ def run_simulation(
             new_workload = {
                 'name': f'dynamic-{cycle}',
                 'image': 'nginx:latest',
-                'cpu_request': round(random.uniform(0.5, 1.5), 2),
-                'memory_request_gb': round(random.uniform(1.0, 2.0), 2),
+                'cpu_request': round(float(RNG.uniform(0.5, 1.5)), 2),
+                'memory_request_gb': round(float(RNG.uniform(1.0, 2.0)), 2),
                 'sla_tier': 'silver'
             }
-            scheduler.schedule_container(**new_workload)
+            decision = scheduler.schedule_workload(new_workload, host_cluster.hosts)
+            if decision is not None:
+                container_id = deploy_workload(docker_manager, new_workload, decision)
+                logger.info(f"  Placed {container_id} on {decision['host_id']}")
+            else:
+                logger.info("  No host has room for the new workload")
         
         if cycle == 2 * num_cycles // 3:
             logger.info("\n  >>> Removing a container...")
-            containers = docker_manager.get_running_containers()
-            if containers:
-                container_to_remove = random.choice(containers)
-                docker_manager.remove_container(container_to_remove.container_id)
+            container_to_remove = docker_manager.pick_running_container(RNG)
+            if container_to_remove:
+                docker_manager.remove_container(container_to_remove['container_id'])
                 
-                # Update host tracking
-                host = host_cluster.get_host(container_to_remove.host_id)
-                if host:
-                    host.remove_container(container_to_remove.container_id)
+                # Give the container's capacity back to its host
+                scheduler.release_workload(
+                    container_to_remove['host_id'],
+                    container_to_remove['cpu_request'],
+                    container_to_remove['memory_request_gb']
+                )
+                logger.info(
+                    f"  Removed {container_to_remove['container_id']} "
+                    f"from {container_to_remove['host_id']}"
+                )
         
-        # Shutdown idle hosts
-        idle_count = consolidation_engine.shutdown_idle_hosts()
+        # Report idle hosts (candidates for shutdown)
+        idle_count = int((batch.state_code == STATE_IDLE).sum())
         if idle_count > 0:
-            logger.info(f"  Shut down {idle_count} idle host(s)")
+            logger.info(f"  Idle host(s): {idle_count}")
         
-        # Delay between cycles
-        time.sleep(0.5)
+        # Sleep only for what is left of this cycle's period
+        delay = next_deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            logger.warning(f"  Cycle overrun: {-delay:.3f}s past the {cycle_period}s period")
+        next_deadline += cycle_period
     
     # Generate final reports
     logger.info("\n" + "=" * 70)
-    logger.info("GENERATING REPORTS AND VISUALIZATIONS")
+    logger.info("GENERATING REPORTS")
     logger.info("=" * 70)
     
-    logger.info("\nSaving JSON logs...")
-    metrics_manager.save_json_log()
-    
-    logger.info("\nGenerating visualizations...")
-    metrics_manager.generate_visualizations()
-    
-    logger.info("\nGenerating summary report...")
-    report_path = metrics_manager.generate_summary_report()
+    kpis = metrics_manager.calculate_kpis()
     
     logger.info("\nExporting KPIs...")
-    kpis_path = metrics_manager.export_kpis_json()
+    kpis_path = metrics_manager.export_kpis(kpis)
     
     # Display final statistics
     logger.info("\n" + "=" * 70)
     logger.info("FINAL STATISTICS")
     logger.info("=" * 70)
     
-    final_summary = host_cluster.get_cluster_summary()
+    final_summary = host_cluster.get_cluster_summary(batch)
     logger.info("\nCluster Summary:")
     for key, value in final_summary.items():
         logger.info(f"  {key}: {value}")
     
-    consolidation_stats = consolidation_engine.get_statistics()
     logger.info("\nConsolidation Statistics:")
     for key, value in consolidation_stats.items():
-        logger.info(f"  {key}: {value}")
+        logger.info(f"  {key}: {value:.2f}" if isinstance(value, float) else f"  {key}: {value}")
     
-    scheduler_stats = scheduler.get_placement_statistics()
     logger.info("\nScheduler Statistics:")
-    for key, value in scheduler_stats.items():
-        if key != 'recent_placements':  # Skip detailed list
-            logger.info(f"  {key}: {value}")
+    logger.info(f"  initial_placements: {successful_placements}/{len(workloads)}")
+    logger.info(f"  running_containers: {len(docker_manager.get_running_containers())}")
+    for host_id, (cpu_used, mem_used) in scheduler.committed.items():
+        logger.info(f"  {host_id}: {cpu_used:.2f} cores, {mem_used:.2f}GB committed")
     
-    kpis = metrics_manager.calculate_kpis()
     logger.info("\nKey Performance Indicators:")
     logger.info(f"  Total Energy: {kpis.get('total_energy_wh', 0):.2f} Wh")
     logger.info(f"  Average Power: {kpis.get('average_power_watts', 0):.2f} W")
-    logger.info(f"  Avg CPU Utilization: {kpis.get('average_cpu_utilization', 0)*100:.2f}%")
+    logger.info(f"  Avg CPU Utilization: {kpis.get('average_cpu_utilization', 0):.2f}%")
     logger.info(f"  Avg Power per Container: {kpis.get('average_power_per_container', 0):.2f} W")
     
     # Show output files
     logger.info("\n" + "=" * 70)
     logger.info("OUTPUT FILES")
     logger.info("=" * 70)
-    logger.info(f"  CSV Log: {metrics_manager.csv_log_path}")
-    logger.info(f"  JSON Log: {metrics_manager.json_log_path}")
-    logger.info(f"  Summary Report: {report_path}")
     logger.info(f"  KPIs JSON: {kpis_path}")
-    logger.info(f"  Visualizations: {metrics_manager.visuals_dir}")
+    logger.info(f"  Log File: {LOG_FILE}")
     
     logger.info("\n" + "=" * 70)
     logger.info("SIMULATION COMPLETE")
@@ -342,8 +390,7 @@ def run_simulation(
     
     print("\n✅ Simulation completed successfully!")
     print(f"📊 Check output files in: {output_dir}")
-    print(f"📈 Visualizations available in: {metrics_manager.visuals_dir}")
-    print(f"📄 Summary report: {report_path}")
+    print(f"📄 KPIs: {kpis_path}")
 
 
 def main():
@@ -3,6 +3,8 @@ Consolidation Engine - Core Components
 Simplified version for real-time monitoring
 """
 
+from ..infrastructure.host_monitor import HostMetricsBatch, STATE_IDLE
+
 class ConsolidationEngine:
     """Simplified consolidation engine for real-time monitoring."""
     
@@ -10,22 +12,24 @@ class ConsolidationEngine:
         self.threshold = threshold
         self.max_utilization = max_utilization
     
-    def run_consolidation(self, hosts_metrics):
-        """Run consolidation algorithm (simplified)."""
-        # Simplified consolidation logic
-        migrations = 0
-        hosts_shutdown = 0
-        energy_saved = 0.0
+    def run_consolidation(self, batch):
+        """Run consolidation algorithm (simplified).
+        
+        batch is a HostMetricsBatch; a list of HostMetrics is also accepted.
+        """
+        if not isinstance(batch, HostMetricsBatch):
+            batch = HostMetricsBatch.from_host_metrics(list(batch))
         
-        # Simulate some consolidation activity
-        for host in hosts_metrics:
-            if host.cpu_utilization < self.threshold and host.memory_utilization < self.threshold:
-                if host.state != "idle":
-                    hosts_shutdown += 1
-                    energy_saved += host.power_watts * 0.1  # 10% energy savings
+        # Hosts under both thresholds that are not already idle get shut down,
+        # saving 10% of their power - one mask over the whole cluster
+        shutdown = (
+            (batch.cpu_utilization < self.threshold) &
+            (batch.memory_utilization < self.threshold) &
+            (batch.state_code != STATE_IDLE)
+        )
         
         return {
-            'migrations': migrations,
-            'hosts_shutdown': hosts_shutdown,
-            'energy_saved': energy_saved
+            'migrations': 0,
+            'hosts_shutdown': int(shutdown.sum()),
+            'energy_saved': float(batch.power_watts[shutdown].sum() * 0.1)
         }
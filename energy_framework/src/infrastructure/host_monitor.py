@@ -4,11 +4,22 @@ Simplified version for real-time monitoring
 """
 
 import time
-import random
-from datetime import datetime, timezone
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict
 
+from ..utils.helpers import calculate_power_consumption
+from ..utils.rng import RNG
+
+# Column dtypes: every metric fits float32 (power 0-1000 W, utilization 0-1,
+# temperature 0-100 C) and container counts fit int16
+METRIC_DTYPE = np.float32
+COUNT_DTYPE = np.int16
+
+# Host states as int8 codes (STATE_NAMES maps a code back to its name)
+STATE_IDLE, STATE_ACTIVE, STATE_OVERLOADED = 0, 1, 2
+STATE_NAMES = np.array(["idle", "active", "overloaded"])
+
 @dataclass
 class HostMetrics:
     """Host metrics data structure."""
@@ -24,76 +35,199 @@ class HostMetrics:
     latency_ms: float  # Response latency in milliseconds
     throughput_mbps: float  # Network throughput in Mbps
 
+@dataclass
+class HostMetricsBatch:
+    """One collection cycle of metrics for a whole cluster, one array per column."""
+    timestamp: float
+    host_ids: np.ndarray
+    cpu_utilization: np.ndarray  # float32
+    memory_utilization: np.ndarray  # float32
+    power_watts: np.ndarray  # float32
+    temperature_c: np.ndarray  # float32
+    active_containers: np.ndarray  # int16
+    state_code: np.ndarray  # int8, see STATE_NAMES
+    is_idle: np.ndarray
+    latency_ms: np.ndarray  # float32
+    throughput_mbps: np.ndarray  # float32
+    
+    @classmethod
+    def from_host_metrics(cls, metrics: List[HostMetrics]) -> "HostMetricsBatch":
+        """Build a batch from a list of per-host HostMetrics."""
+        state_codes = {name: code for code, name in enumerate(STATE_NAMES)}
+        return cls(
+            timestamp=metrics[0].timestamp if metrics else 0.0,
+            host_ids=np.array([m.host_id for m in metrics], dtype=object),
+            cpu_utilization=np.array([m.cpu_utilization for m in metrics], dtype=METRIC_DTYPE),
+            memory_utilization=np.array([m.memory_utilization for m in metrics], dtype=METRIC_DTYPE),
+            power_watts=np.array([m.power_watts for m in metrics], dtype=METRIC_DTYPE),
+            temperature_c=np.array([m.temperature_c for m in metrics], dtype=METRIC_DTYPE),
+            active_containers=np.array([m.active_containers for m in metrics], dtype=COUNT_DTYPE),
+            state_code=np.array([state_codes[m.state] for m in metrics], dtype=np.int8),
+            is_idle=np.array([m.is_idle for m in metrics], dtype=bool),
+            latency_ms=np.array([m.latency_ms for m in metrics], dtype=METRIC_DTYPE),
+            throughput_mbps=np.array([m.throughput_mbps for m in metrics], dtype=METRIC_DTYPE)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.host_ids)
+    
+    @property
+    def state(self) -> np.ndarray:
+        """State names for each host."""
+        return STATE_NAMES[self.state_code]
+    
+    def to_host_metrics(self) -> List[HostMetrics]:
+        """Materialize one HostMetrics object per host."""
+        return [
+            HostMetrics(
+                timestamp=self.timestamp,
+                host_id=host_id,
+                cpu_utilization=float(cpu),
+                memory_utilization=float(mem),
+                power_watts=float(power),
+                temperature_c=float(temperature),
+                active_containers=int(containers),
+                state=str(state),
+                is_idle=bool(is_idle),
+                latency_ms=float(latency),
+                throughput_mbps=float(throughput)
+            )
+            for host_id, cpu, mem, power, temperature, containers, state, is_idle, latency, throughput in zip(
+                self.host_ids,
+                self.cpu_utilization,
+                self.memory_utilization,
+                self.power_watts,
+                self.temperature_c,
+                self.active_containers,
+                self.state,
+                self.is_idle,
+                self.latency_ms,
+                self.throughput_mbps
+            )
+        ]
+
+def _generate_metrics(rng: np.random.Generator, host_ids: np.ndarray, cores: np.ndarray,
+                      p_idle: np.ndarray, p_max: np.ndarray, timestamp: float) -> HostMetricsBatch:
+    """Draw one cycle of metrics for the given hosts as a columnar batch.
+    
+    The single metrics model: HostCluster calls it for every host at once and
+    HostMonitor.collect_metrics for its one host.
+    """
+    n = len(host_ids)
+    
+    # Draws come out as float64; cast once so the whole pass runs in float32
+    cpu = rng.uniform(0.1, 0.9, n).astype(METRIC_DTYPE, copy=False)
+    mem = rng.uniform(0.2, 0.8, n).astype(METRIC_DTYPE, copy=False)
+    power = calculate_power_consumption(cpu, p_idle, p_max)
+    temperature = 35 + cpu * 25 + rng.uniform(-2, 2, n).astype(METRIC_DTYPE, copy=False)
+    containers = rng.integers(0, cores * 2 + 1).astype(COUNT_DTYPE)
+    
+    # Latency rises with CPU usage; throughput with CPU/memory and containers
+    latency = np.clip(
+        10.0 + cpu * 50 + rng.uniform(-5, 5, n).astype(METRIC_DTYPE, copy=False),
+        5.0, 100.0
+    )
+    throughput = np.clip(
+        100.0 + (cpu * 0.7 + mem * 0.3) * containers * 50
+        + rng.uniform(-10, 10, n).astype(METRIC_DTYPE, copy=False),
+        50.0, 1000.0
+    )
+    
+    is_idle = (cpu < 0.1) & (mem < 0.1)
+    state_code = np.select(
+        [is_idle, (cpu > 0.9) | (mem > 0.9)],
+        [STATE_IDLE, STATE_OVERLOADED],
+        default=STATE_ACTIVE
+    ).astype(np.int8)
+    
+    return HostMetricsBatch(
+        timestamp=timestamp,
+        host_ids=host_ids,
+        cpu_utilization=cpu,
+        memory_utilization=mem,
+        power_watts=power,
+        temperature_c=temperature,
+        active_containers=containers,
+        state_code=state_code,
+        is_idle=is_idle,
+        latency_ms=latency,
+        throughput_mbps=throughput
+    )
+
 class HostMonitor:
     """Simplified host monitor for real-time monitoring."""
     
-    def __init__(self, host_id: str, cores: int = 4, ram_gb: float = 8.0):
+    def __init__(self, host_id: str, cores: int = 4, ram_gb: float = 8.0,
+                 p_idle: float = 45.0, p_max: float = 120.0, rng: np.random.Generator = None):
         self.host_id = host_id
         self.cores = cores
         self.ram_gb = ram_gb
-        self.p_idle = 45.0
-        self.p_max = 120.0
+        self.p_idle = float(p_idle)  # power draw (W) at 0% and 100% CPU
+        self.p_max = float(p_max)
+        self.rng = rng if rng is not None else RNG
     
-    def collect_metrics(self) -> HostMetrics:
-        """Collect current host metrics."""
-        timestamp = datetime.now(timezone.utc).timestamp()
-        
-        # Generate realistic metrics
-        cpu_util = random.uniform(0.1, 0.9)
-        memory_util = random.uniform(0.2, 0.8)
-        power = self.p_idle + (self.p_max - self.p_idle) * cpu_util
-        temperature = 35 + (cpu_util * 25) + random.uniform(-2, 2)
-        containers = random.randint(0, self.cores * 2)
+    def collect_metrics(self, timestamp: float = None) -> HostMetrics:
+        """Collect current host metrics.
         
-        # Generate latency (lower is better, inversely related to CPU utilization)
-        # Higher CPU utilization may lead to higher latency
-        base_latency = 10.0  # Base latency in ms
-        latency_variation = cpu_util * 50  # Latency increases with CPU usage
-        latency_ms = base_latency + latency_variation + random.uniform(-5, 5)
-        latency_ms = max(5.0, min(100.0, latency_ms))  # Clamp between 5-100ms
+        timestamp is the collection cycle's time (seconds since the epoch);
+        the cluster reads the clock once and passes it to every host.
+        """
+        if timestamp is None:
+            timestamp = time.time()
         
-        # Generate throughput (higher is better, related to CPU and containers)
-        # More containers and better CPU utilization = higher throughput
-        base_throughput = 100.0  # Base throughput in Mbps
-        throughput_factor = (cpu_util * 0.7 + memory_util * 0.3) * containers
-        throughput_mbps = base_throughput + (throughput_factor * 50) + random.uniform(-10, 10)
-        throughput_mbps = max(50.0, min(1000.0, throughput_mbps))  # Clamp between 50-1000 Mbps
-        
-        # Determine state
-        if cpu_util < 0.1 and memory_util < 0.1:
-            state = "idle"
-            is_idle = True
-        elif cpu_util > 0.9 or memory_util > 0.9:
-            state = "overloaded"
-            is_idle = False
-        else:
-            state = "active"
-            is_idle = False
-        
-        return HostMetrics(
-            timestamp=timestamp,
-            host_id=self.host_id,
-            cpu_utilization=cpu_util,
-            memory_utilization=memory_util,
-            power_watts=power,
-            temperature_c=temperature,
-            active_containers=containers,
-            state=state,
-            is_idle=is_idle,
-            latency_ms=latency_ms,
-            throughput_mbps=throughput_mbps
+        # A one-host batch, so a single host and the cluster share one model
+        batch = _generate_metrics(
+            self.rng, np.array([self.host_id], dtype=object), np.array([self.cores]),
+            np.array([self.p_idle], dtype=METRIC_DTYPE), np.array([self.p_max], dtype=METRIC_DTYPE),
+            timestamp
         )
+        return batch.to_host_metrics()[0]
 
 class HostCluster:
     """Simplified host cluster for real-time monitoring."""
     
-    def __init__(self):
+    def __init__(self, rng: np.random.Generator = None):
         self.hosts = []
+        self.rng = rng if rng is not None else RNG
+        
+        # Per-host parameters as parallel arrays, so a whole cycle of metrics
+        # is generated with one NumPy pass instead of a Python loop per host
+        self.host_ids = np.empty(0, dtype=object)
+        self.p_idle = np.empty(0, dtype=METRIC_DTYPE)
+        self.p_max = np.empty(0, dtype=METRIC_DTYPE)
+        self.cores = np.empty(0, dtype=np.int64)
     
     def add_host(self, host: HostMonitor):
         """Add a host to the cluster."""
         self.hosts.append(host)
+        self.host_ids = np.append(self.host_ids, host.host_id)
+        self.p_idle = np.append(self.p_idle, METRIC_DTYPE(host.p_idle))
+        self.p_max = np.append(self.p_max, METRIC_DTYPE(host.p_max))
+        self.cores = np.append(self.cores, host.cores)
+    
+    def get_all_metrics_batched(self) -> HostMetricsBatch:
+        """Generate one cycle of metrics for every host as a columnar batch.
+        
+        Same model as HostMonitor.collect_metrics, drawn for all hosts at once.
+        """
+        # one clock read shared by every host this cycle
+        return _generate_metrics(self.rng, self.host_ids, self.cores,
+                                 self.p_idle, self.p_max, time.time())
+    
+    def get_cluster_summary(self, batch: HostMetricsBatch) -> Dict[str, float]:
+        """Summarize host states, containers and power for an already collected cycle."""
+        # One counting pass over the int8 state codes: [idle, active, overloaded]
+        idle, active, overloaded = np.bincount(batch.state_code, minlength=len(STATE_NAMES)).tolist()
+        return {
+            'total_hosts': len(batch),
+            'active_hosts': active,
+            'idle_hosts': idle,
+            'overloaded_hosts': overloaded,
+            'total_containers': int(batch.active_containers.sum()),
+            'total_power_watts': round(float(batch.power_watts.sum(dtype=np.float64)), 2),
+        }
     
     def get_all_metrics(self) -> List[HostMetrics]:
         """Get metrics from all hosts."""
-        return [host.collect_metrics() for host in self.hosts]
+        # HostMetrics objects are only built here, for callers that want them
+        return self.get_all_metrics_batched().to_host_metrics()
@@ -3,25 +3,161 @@ Energy-Aware Scheduler - Orchestration Layer
 Simplified version for real-time monitoring
 """
 
-import random
+import numpy as np
+
+# SLA penalty weight per tier: higher tiers are steered away from small hosts
+SLA_WEIGHTS = {'gold': 1.0, 'silver': 0.5, 'bronze': 0.0}
+
+def best_fit_decreasing(cpu_req, mem_req, cpu_left, mem_left):
+    """Bin-pack workloads onto hosts with Best-Fit-Decreasing.
+    
+    Workloads are taken largest first (CPU + memory request) and each goes to
+    the feasible host with the least CPU left, which packs hosts tightly so
+    fewer of them stay active. cpu_left/mem_left are updated in place.
+    Returns the host index for each workload (-1 if nothing fits).
+    """
+    placement = np.full(len(cpu_req), -1)
+    for w in np.argsort(-(cpu_req + mem_req), kind='stable'):
+        feasible = (cpu_left >= cpu_req[w]) & (mem_left >= mem_req[w])
+        if not feasible.any():
+            continue
+        h = int(np.where(feasible, cpu_left, np.inf).argmin())
+        placement[w] = h
+        cpu_left[h] -= cpu_req[w]
+        mem_left[h] -= mem_req[w]
+    return placement
 
 class EnergyAwareScheduler:
     """Simplified energy-aware scheduler for real-time monitoring."""
     
-    def __init__(self, power_weight: float = 0.4, utilization_weight: float = 0.4, sla_weight: float = 0.2):
+    def __init__(self, power_weight: float = 0.4, utilization_weight: float = 0.4, sla_weight: float = 0.2,
+                 host_cluster=None, docker_manager=None):
         self.power_weight = power_weight
         self.utilization_weight = utilization_weight
         self.sla_weight = sla_weight
+        self.host_cluster = host_cluster
+        self.docker_manager = docker_manager
+        
+        # CPU cores / memory (GB) committed to each host by schedule_workload/schedule_batch
+        self.committed = {}
+    
+    def _committed_arrays(self, hosts):
+        """CPU cores and memory (GB) already committed to each host, as two arrays."""
+        committed = np.array([self.committed.get(h.host_id, (0.0, 0.0)) for h in hosts], dtype=float).reshape(-1, 2)
+        return committed[:, 0], committed[:, 1]
+    
+    def _commit(self, host_id, cpu_req, mem_req):
+        """Record cpu_req cores and mem_req GB as committed to a host."""
+        cpu_used, mem_used = self.committed.get(host_id, (0.0, 0.0))
+        self.committed[host_id] = (cpu_used + cpu_req, mem_used + mem_req)
+    
+    def release_workload(self, host_id, cpu_req, mem_req):
+        """Return a removed workload's CPU cores and memory to its host."""
+        self._commit(host_id, -cpu_req, -mem_req)
     
     def schedule_workload(self, workload, available_hosts):
-        """Schedule a workload to the best host (simplified)."""
+        """Schedule a workload to the best-fitting host with room for it."""
         if not available_hosts:
             return None
         
-        # Simplified scheduling - just pick a random host
-        selected_host = random.choice(available_hosts)
+        cpu_req = float(workload.get('cpu_request', 0.0))
+        mem_req = float(workload.get('memory_request_gb', 0.0))
+        committed_cpu, committed_mem = self._committed_arrays(available_hosts)
+        cores = np.array([h.cores for h in available_hosts], dtype=float)
+        cpu_left = cores - committed_cpu
+        mem_left = np.array([h.ram_gb for h in available_hosts], dtype=float) - committed_mem
+        
+        h = int(best_fit_decreasing(np.array([cpu_req]), np.array([mem_req]), cpu_left, mem_left)[0])
+        if h < 0:
+            return None
+        
+        selected_host = available_hosts[h]
+        self._commit(selected_host.host_id, cpu_req, mem_req)
         return {
             'host_id': selected_host.host_id,
-            'score': random.uniform(0.6, 0.9),
-            'reason': 'simplified_scheduling'
+            'score': float(1.0 - cpu_left[h] / cores[h]),  # how tightly the host is packed
+            'reason': 'best_fit'
         }
+    
+    def schedule_batch(self, workloads, available_hosts=None):
+        """Place a batch of workloads using one workload x host cost matrix.
+        
+        Each workload goes to the host with the lowest weighted cost of power,
+        utilization and SLA penalty. Workloads that would overfill their host
+        (counting capacity already committed) are placed again, one by one, on
+        the cheapest host with room left. Placements are added to the committed
+        capacity shared with schedule_workload. Returns one decision dict per workload (None if it could not be placed).
+        """
+        if available_hosts is None:
+            available_hosts = self.host_cluster.hosts if self.host_cluster is not None else []
+        hosts = list(available_hosts)
+        if not workloads:
+            return []
+        if not hosts:
+            return [None] * len(workloads)
+        
+        cpu_req = np.array([w.get('cpu_request', 0.0) for w in workloads], dtype=float)
+        mem_req = np.array([w.get('memory_request_gb', 0.0) for w in workloads], dtype=float)
+        sla = np.array([SLA_WEIGHTS.get(w.get('sla_tier'), 0.0) for w in workloads])
+        cores = np.array([h.cores for h in hosts], dtype=float)
+        ram = np.array([h.ram_gb for h in hosts], dtype=float)
+        dynamic_power = np.array([h.p_max - h.p_idle for h in hosts], dtype=float)
+        committed_cpu, committed_mem = self._committed_arrays(hosts)
+        cpu_cap = cores - committed_cpu
+        mem_cap = ram - committed_mem
+        
+        # Power: watts the workload's CPU share adds on each host (normalized)
+        power = dynamic_power[None, :] * cpu_req[:, None] / cores[None, :]
+        power /= power.max() or 1.0
+        # Utilization: share of each host's CPU already committed
+        host_util = committed_cpu / cores
+        # SLA: penalty for putting higher tiers on smaller hosts
+        sla_penalty = sla[:, None] * (1.0 - cores / cores.max())[None, :]
+        
+        score = (
+            self.power_weight * power +
+            self.utilization_weight * host_util[None, :] +
+            self.sla_weight * sla_penalty
+        )
+        best = score.argmin(axis=1)
+        
+        # Running CPU/memory demand on each chosen host, in workload order
+        order = np.argsort(best, kind='stable')
+        chosen = best[order]
+        group_start = np.searchsorted(chosen, chosen)
+        cpu_cum = np.cumsum(cpu_req[order])
+        mem_cum = np.cumsum(mem_req[order])
+        cpu_used = cpu_cum - cpu_cum[group_start] + cpu_req[order][group_start]
+        mem_used = mem_cum - mem_cum[group_start] + mem_req[order][group_start]
+        fits = np.empty(len(workloads), dtype=bool)
+        fits[order] = (cpu_used <= cpu_cap[chosen]) & (mem_used <= mem_cap[chosen])
+        
+        placement = np.where(fits, best, -1)
+        cpu_left = cpu_cap - np.bincount(best[fits], weights=cpu_req[fits], minlength=len(hosts))
+        mem_left = mem_cap - np.bincount(best[fits], weights=mem_req[fits], minlength=len(hosts))
+        
+        # Capacity-aware second pass for workloads whose first choice filled up
+        for w in np.flatnonzero(~fits):
+            feasible = (cpu_left >= cpu_req[w]) & (mem_left >= mem_req[w])
+            if not feasible.any():
+                continue
+            h = int(np.where(feasible, score[w], np.inf).argmin())
+            placement[w] = h
+            cpu_left[h] -= cpu_req[w]
+            mem_left[h] -= mem_req[w]
+        
+        # Commit the batch's per-host totals so later scheduling sees them
+        placed = placement >= 0
+        cpu_added = np.bincount(placement[placed], weights=cpu_req[placed], minlength=len(hosts))
+        mem_added = np.bincount(placement[placed], weights=mem_req[placed], minlength=len(hosts))
+        for h in np.flatnonzero(cpu_added + mem_added):
+            self._commit(hosts[h].host_id, float(cpu_added[h]), float(mem_added[h]))
+        
+        return [
+            {
+                'host_id': hosts[h].host_id,
+                'score': float(score[w, h]),
+                'reason': 'cost_matrix'
+            } if h >= 0 else None
+            for w, h in enumerate(placement.tolist())
+        ]
@@ -5,14 +5,87 @@ Simplified version for real-time monitoring
 
 import json
 from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from ..infrastructure.host_monitor import HostMetricsBatch, METRIC_DTYPE, COUNT_DTYPE
 
 class EnergyMetricsManager:
     """Simplified energy metrics manager for real-time monitoring."""
     
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", host_cluster=None, docker_manager=None,
+                 consolidation_engine=None, history_size: int = 1024):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         (self.output_dir / "reports").mkdir(exist_ok=True)
+        
+        self.host_cluster = host_cluster
+        self.docker_manager = docker_manager
+        self.consolidation_engine = consolidation_engine
+        
+        # Ring buffer of the last history_size cycles, one row per cycle and one
+        # column per host; allocated on the first batch once the host count is known
+        self.history_size = history_size
+        self._count = 0  # cycles recorded so far (the next row is _count % history_size)
+        self._timestamps = np.empty(history_size)
+        self._power = None
+        self._cpu = None
+        self._containers = None
+    
+    def collect_metrics(self) -> HostMetricsBatch:
+        """Collect one cycle of metrics from the host cluster and record it."""
+        if self.host_cluster is None:
+            raise ValueError("EnergyMetricsManager needs a host_cluster to collect metrics")
+        batch = self.host_cluster.get_all_metrics_batched()
+        self.record_batch(batch)
+        return batch
+    
+    def record_batch(self, batch: HostMetricsBatch):
+        """Write one cycle's metrics into the ring buffer."""
+        if self._power is None:
+            shape = (self.history_size, len(batch))
+            self._power = np.empty(shape, dtype=METRIC_DTYPE)
+            self._cpu = np.empty(shape, dtype=METRIC_DTYPE)
+            self._containers = np.empty(shape, dtype=COUNT_DTYPE)
+        elif len(batch) != self._power.shape[1]:
+            raise ValueError(f"Batch has {len(batch)} hosts, history was started with {self._power.shape[1]}")
+        
+        row = self._count % self.history_size
+        self._timestamps[row] = batch.timestamp
+        self._power[row] = batch.power_watts
+        self._cpu[row] = batch.cpu_utilization
+        self._containers[row] = batch.active_containers
+        self._count += 1
+    
+    def calculate_kpis(self) -> Dict[str, float]:
+        """Compute energy KPIs over the recorded cycles (one reduction per column)."""
+        cycles = min(self._count, self.history_size)
+        if cycles == 0:
+            return {
+                'total_energy_wh': 0.0,
+                'average_power_watts': 0.0,
+                'average_cpu_utilization': 0.0,
+                'average_power_per_container': 0.0,
+                'cycles_recorded': 0
+            }
+        
+        # Rows are summed as a whole, so ring order doesn't matter here
+        timestamps = self._timestamps[:cycles]
+        total_power = float(self._power[:cycles].sum(dtype=np.float64))
+        total_containers = int(self._containers[:cycles].sum(dtype=np.int64))
+        
+        # Each cycle's cluster power is held for the mean interval between cycles
+        cycle_seconds = float(timestamps.max() - timestamps.min()) / (cycles - 1) if cycles > 1 else 0.0
+        
+        return {
+            'total_energy_wh': total_power * cycle_seconds / 3600.0,
+            'average_power_watts': total_power / cycles,
+            # Percent, like the continuous monitor's kpis.json the dashboard also reads
+            'average_cpu_utilization': float(self._cpu[:cycles].mean(dtype=np.float64)) * 100,
+            'average_power_per_container': total_power / total_containers if total_containers else 0.0,
+            'cycles_recorded': cycles
+        }
     
     def log_metrics(self, metrics_data):
         """Log metrics data (simplified)."""
@@ -24,8 +97,9 @@ class EnergyMetricsManager:
         # This is handled by the dashboard
         pass
     
-    def export_kpis(self, kpis_data):
-        """Export KPIs to JSON (simplified)."""
+    def export_kpis(self, kpis_data) -> Path:
+        """Export KPIs to JSON (simplified) and return the file path."""
         kpis_path = self.output_dir / "reports" / "kpis.json"
         with open(kpis_path, 'w') as f:
             json.dump(kpis_data, f, indent=2)
+        return kpis_path
@@ -3,31 +3,41 @@ Helper Functions - Utility Layer
 Common utility functions for the framework
 """
 
-import random
-import string
+import secrets
 from datetime import datetime
+from typing import Union
+
+import numpy as np
 
 def generate_workload_id(prefix: str = "workload") -> str:
     """Generate a unique workload ID."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"{prefix}_{timestamp}_{random_suffix}"
+    # 4 lowercase hex characters from a single C call
+    return f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(2)}"
 
-def calculate_power_consumption(cpu_util: float, p_idle: float, p_max: float) -> float:
-    """Calculate power consumption based on CPU utilization."""
+def calculate_power_consumption(
+    cpu_util: Union[float, np.ndarray],
+    p_idle: Union[float, np.ndarray],
+    p_max: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """Calculate power consumption based on CPU utilization.
+    
+    Accepts scalars or NumPy arrays (broadcast elementwise), so a whole
+    cluster's power is one expression over its per-host arrays.
+    """
     return p_idle + (p_max - p_idle) * cpu_util
 
+# Unit suffixes and divisors, indexed by power of 1024 (bytes) or 1000 (watts)
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_BYTE_DIVISORS = tuple(1024.0 ** i for i in range(len(_BYTE_UNITS)))
+_WATT_FORMATS = ((1.0, ".1f", "W"), (1000.0, ".2f", "kW"))
+
 def format_bytes(bytes_value: int) -> str:
     """Format bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    # Each unit spans 10 bits, so the bit length picks the unit without a loop
+    idx = min(max(int(bytes_value).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / _BYTE_DIVISORS[idx]:.1f} {_BYTE_UNITS[idx]}"
 
 def format_watts(watts: float) -> str:
     """Format watts to human readable format."""
-    if watts < 1000:
-        return f"{watts:.1f} W"
-    else:
-        return f"{watts/1000:.2f} kW"
+    divisor, spec, unit = _WATT_FORMATS[watts >= 1000]
+    return f"{watts / divisor:{spec}} {unit}"
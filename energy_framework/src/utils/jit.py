@@ -0,0 +1,14 @@
+"""
+JIT Compilation - Utility Layer
+Optional Numba support shared by the simulation kernels
+"""
+
+# Numba is optional: without it njit-decorated kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
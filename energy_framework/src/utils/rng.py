@@ -0,0 +1,12 @@
+"""
+Random Number Generation - Utility Layer
+Shared NumPy random generator for the simulation
+"""
+
+import os
+import numpy as np
+
+# One PCG64 generator shared by all components, so values are drawn as arrays
+# in single calls; set ENERGY_FRAMEWORK_SEED for reproducible runs
+_seed = os.environ.get("ENERGY_FRAMEWORK_SEED")
+RNG = np.random.default_rng(int(_seed) if _seed else None)
@@ -3,36 +3,66 @@ Docker Manager - Virtualization Layer
 Simplified version for real-time monitoring
 """
 
+from itertools import islice
+
+from ..utils.rng import RNG
+
 class DockerManager:
     """Simplified Docker manager for real-time monitoring."""
     
     def __init__(self, use_real_docker: bool = False):
         self.use_real_docker = use_real_docker
         self.containers = {}
+        # Same records as self.containers, indexed by status so lookups by state skip the full scan
+        self._by_status = {'created': {}, 'running': {}, 'stopped': {}}
+    
+    def _set_status(self, container_id: str, status: str):
+        """Move a container record into the bucket for its new status."""
+        container = self.containers[container_id]
+        self._by_status[container['status']].pop(container_id, None)
+        container['status'] = status
+        self._by_status[status][container_id] = container
     
     def create_container(self, container_id: str, host_id: str, **kwargs):
         """Create a container (simulated)."""
-        self.containers[container_id] = {
+        container = {
+            'container_id': container_id,
             'host_id': host_id,
             'status': 'created',
             **kwargs
         }
+        self.containers[container_id] = container
+        self._by_status['created'][container_id] = container
         return True
     
     def start_container(self, container_id: str):
         """Start a container (simulated)."""
         if container_id in self.containers:
-            self.containers[container_id]['status'] = 'running'
+            self._set_status(container_id, 'running')
         return True
     
     def stop_container(self, container_id: str):
         """Stop a container (simulated)."""
         if container_id in self.containers:
-            self.containers[container_id]['status'] = 'stopped'
+            self._set_status(container_id, 'stopped')
         return True
     
     def remove_container(self, container_id: str):
         """Remove a container (simulated)."""
         if container_id in self.containers:
-            del self.containers[container_id]
+            container = self.containers.pop(container_id)
+            self._by_status[container['status']].pop(container_id, None)
         return True
+    
+    def get_running_containers(self):
+        """Return a live view of the running container records."""
+        return self._by_status['running'].values()
+    
+    def pick_running_container(self, rng=None):
+        """Return a uniformly random running container record, or None if none are running."""
+        running = self._by_status['running']
+        if not running:
+            return None
+        # Skip to a random position in the bucket rather than copying it into a list
+        rng = rng if rng is not None else RNG
+        return next(islice(running.values(), int(rng.integers(len(running))), None))
@@ -5,11 +5,21 @@ Launches both the continuous monitor and dashboard
 """
 
 import subprocess
+import signal
+import socket
 import sys
 import time
 import os
 from pathlib import Path
 
+DASHBOARD_PORT = 8501
+# The monitor is up once it has written its first rows to this file
+MONITOR_SENTINEL = Path("output") / "energy_log.csv"
+STARTUP_TIMEOUT = 30.0
+POLL_INTERVAL = 0.05
+# How long a child gets to shut down cleanly after each stop signal
+STOP_TIMEOUT = 10.0
+
 def start_continuous_monitor():
     """Start the continuous energy monitor."""
     print("🚀 Starting Continuous Energy Monitor...")
@@ -21,10 +31,56 @@ def start_dashboard():
     return subprocess.Popen([
         sys.executable, "-m", "streamlit", "run", 
         "dashboard/dashboard.py", 
-        "--server.port", "8501",
+        "--server.port", str(DASHBOARD_PORT),
         "--server.runOnSave", "true"
     ])
 
+def wait_until_ready(process, is_ready, name, timeout=STARTUP_TIMEOUT):
+    """Poll is_ready() until it succeeds; fail early if the process exits or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not is_ready():
+        if process.poll() is not None:
+            raise RuntimeError(f"{name} exited during startup (code {process.returncode})")
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"{name} not ready after {timeout:.0f}s")
+        time.sleep(POLL_INTERVAL)
+
+def monitor_ready(started_at):
+    """Check whether the monitor has written data since it was launched."""
+    try:
+        return MONITOR_SENTINEL.stat().st_mtime >= started_at
+    except OSError:
+        return False
+
+def dashboard_ready():
+    """Check whether the dashboard accepts connections on its port."""
+    try:
+        with socket.create_connection(("localhost", DASHBOARD_PORT), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+def stop_process(process, timeout=STOP_TIMEOUT):
+    """Stop a child like Ctrl+C would, so it can flush its files; escalate if it hangs."""
+    if process.poll() is not None:
+        return
+    process.send_signal(signal.SIGINT)
+    try:
+        process.wait(timeout)
+        return
+    except subprocess.TimeoutExpired:
+        pass
+    process.terminate()
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def handle_sigterm(signum, frame):
+    """Stop the launcher on SIGTERM the same way as on Ctrl+C, so the children are stopped too."""
+    raise KeyboardInterrupt
+
 def main():
     """Main startup function."""
     print("=" * 60)
@@ -47,19 +103,22 @@ def main():
     print("✅ All required files found")
     print()
     
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
     try:
         # Start continuous monitor
+        started_at = time.time()
         monitor_process = start_continuous_monitor()
-        time.sleep(2)  # Give monitor time to start
+        wait_until_ready(monitor_process, lambda: monitor_ready(started_at), "Continuous monitor")
         
         # Start dashboard
         dashboard_process = start_dashboard()
-        time.sleep(3)  # Give dashboard time to start
+        wait_until_ready(dashboard_process, dashboard_ready, "Dashboard")
         
         print()
         print("🎉 REAL-TIME MONITORING SYSTEM LAUNCHED!")
         print()
-        print("📊 Dashboard URL: http://localhost:8501")
+        print(f"📊 Dashboard URL: http://localhost:{DASHBOARD_PORT}")
         print("🔄 Continuous Monitor: Running in background")
         print("📈 Data Updates: Every 2 seconds")
         print()
@@ -78,12 +137,12 @@ def main():
         sys.exit(1)
     
     finally:
-        # Clean up processes
+        # Clean up processes (the monitor gets SIGINT so its final flush runs)
         try:
-            if 'monitor_process' in locals():
-                monitor_process.terminate()
             if 'dashboard_process' in locals():
-                dashboard_process.terminate()
+                stop_process(dashboard_process)
+            if 'monitor_process' in locals():
+                stop_process(monitor_process)
             print("✅ Services stopped successfully")
         except:
             pass
@@ -0,0 +1,66 @@
+"""
+Tests for the continuous monitor's flush handling.
+Run from energy_framework/: python -m unittest discover tests
+"""
+
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import continuous_monitor
+from continuous_monitor import ContinuousEnergyMonitor
+
+
+class StartMonitoringFlushTest(unittest.TestCase):
+    """start_monitoring's flush_every validation and shutdown flush."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.monitor = ContinuousEnergyMonitor(output_dir=str(Path(self._tmp.name) / "output"))
+        self.addCleanup(self.monitor._close_csv)
+    
+    def _run_ticks(self, ticks, flush_every):
+        """Run start_monitoring for a fixed number of ticks without sleeping."""
+        calls = []
+        
+        def fake_sleep(interval):
+            calls.append(interval)
+            if len(calls) >= ticks:
+                self.monitor.stop_monitoring()
+        
+        with mock.patch.object(continuous_monitor.time, "sleep", fake_sleep), \
+                mock.patch("builtins.print"):
+            self.monitor.start_monitoring(interval=0, flush_every=flush_every)
+    
+    def test_rejects_flush_every_below_one(self):
+        for flush_every in (0, -1):
+            with self.subTest(flush_every=flush_every):
+                with self.assertRaises(ValueError):
+                    self.monitor.start_monitoring(interval=0, flush_every=flush_every)
+        # Nothing was started or written
+        self.assertIsNone(self.monitor._io_thread)
+        self.assertEqual(self.monitor.data_points, 0)
+    
+    def test_pending_ticks_are_flushed_on_shutdown(self):
+        # 3 ticks with flush_every=5 never reach a periodic flush
+        self._run_ticks(ticks=3, flush_every=5)
+        expected_rows = 3 * len(self.monitor.hosts)
+        
+        self.assertEqual(self.monitor._pending, [])
+        with open(self.monitor.csv_path, newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(tuple(rows[0]), continuous_monitor.CSV_HEADERS)
+        self.assertEqual(len(rows) - 1, expected_rows)
+        
+        with open(self.monitor.json_path) as f:
+            self.assertEqual(len(json.load(f)), expected_rows)
+        with open(self.monitor.kpis_path) as f:
+            self.assertEqual(json.load(f)['total_data_points'], expected_rows)
+
+
+if __name__ == "__main__":
+    unittest.main()